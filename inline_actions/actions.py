@@ -1,23 +1,24 @@
+import csv
 from typing import Callable, List, Optional, Union
 
 from django.contrib import messages
+from django.contrib.admin.options import InlineModelAdmin
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+from django.forms.models import _get_foreign_key
+from django.http import StreamingHttpResponse
 from django.shortcuts import redirect
-from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
+from .utils import get_admin_url, get_content_disposition
+
 
 class ViewAction:
     inline_actions: Optional[List[Union[str, Callable]]] = ['view_action']
 
     def view_action(self, request, obj, parent_obj=None):
         """Redirect to changeform of selcted inline instance"""
-        url = reverse(
-            'admin:{}_{}_change'.format(
-                obj._meta.app_label,
-                obj._meta.model_name,
-            ),
-            args=(obj.pk,),
-        )
+        url = get_admin_url(self.admin_site.name, obj._meta, 'change', obj.pk)
         return redirect(url)
 
     view_action.short_description = _("View")  # type: ignore
@@ -26,17 +27,124 @@ class ViewAction:
 class DeleteAction:
     def get_inline_actions(self, request, obj=None):
         actions = super().get_inline_actions(request, obj)
-        if self.has_delete_permission(request, obj):
+        if self.has_inline_action_permission(request, 'delete', obj):
             actions.append('delete_action')
         return actions
 
+    def get_inline_actions_for_objects(self, request, objs):
+        # check the permission of all objects at once
+        self._prefetch_inline_action_permission(request, 'delete', objs)
+        return super().get_inline_actions_for_objects(request, objs)
+
     def delete_action(self, request, obj, parent_obj=None):
         """Remove selected inline instance if permission is sufficient"""
-        if self.has_delete_permission(request):
-            obj.delete()
-            messages.info(request, "`{}` deleted.".format(obj))
+        obj.delete()
+        messages.info(request, "`{}` deleted.".format(obj))
 
     delete_action.short_description = _("Delete")  # type: ignore
+    delete_action.allowed_permissions = ('delete',)  # type: ignore
+
+
+class _Echo:
+    """
+    File-like object returning the written value, used to stream csv rows.
+    """
+
+    def write(self, value):
+        return value
+
+
+class ExportAction:
+    """
+    Streams objects as CSV or JSON lines without loading model instances.
+
+    On an inline, all objects of the inline related to the parent object are
+    exported. On the changelist, the object of the row or all selected rows
+    are exported.
+    """
+
+    inline_actions: Optional[List[Union[str, Callable]]] = ['export_action']
+
+    # exported fields, defaults to all concrete fields
+    export_fields: Optional[List[str]] = None
+    # `csv` or `jsonl`
+    export_format: str = 'csv'
+    # rows fetched from the database and sent at once
+    export_chunk_size: int = 2000
+
+    EXPORT_CONTENT_TYPES = {
+        'csv': 'text/csv; charset=utf-8',
+        'jsonl': 'application/x-ndjson; charset=utf-8',
+    }
+
+    def export_action(self, request, queryset, parent_obj=None):
+        """Stream the selected objects or all objects of the inline"""
+        if self.export_format not in self.EXPORT_CONTENT_TYPES:
+            raise ImproperlyConfigured(
+                "Unknown export format `{}`.".format(self.export_format)
+            )
+
+        if parent_obj is not None and isinstance(self, InlineModelAdmin):
+            queryset = self.get_export_queryset(request, parent_obj)
+        fields = self.get_export_fields(request)
+        # related objects can't be prefetched for plain values
+        rows = (
+            queryset.prefetch_related(None)
+            .values_list(*fields)
+            .iterator(chunk_size=self.export_chunk_size)
+        )
+        lines = getattr(self, '_export_{}'.format(self.export_format))(fields, rows)
+
+        response = StreamingHttpResponse(
+            self._chunk_export(lines),
+            content_type=self.EXPORT_CONTENT_TYPES[self.export_format],
+        )
+        response['Content-Disposition'] = get_content_disposition(
+            '{}.{}'.format(queryset.model._meta.model_name, self.export_format)
+        )
+        return response
+
+    export_action.short_description = _("Export")  # type: ignore
+    export_action.bulk = True  # type: ignore
+
+    def get_export_fields(self, request):
+        """
+        Returns the names of the exported fields.
+        """
+        if self.export_fields is not None:
+            return list(self.export_fields)
+        return [field.attname for field in self.model._meta.concrete_fields]
+
+    def get_export_queryset(self, request, parent_obj):
+        """
+        Returns all objects of the inline related to `parent_obj`.
+        """
+        fk = _get_foreign_key(self.parent_model, self.model, fk_name=self.fk_name)
+        return self.get_queryset(request).filter(**{fk.name: parent_obj})
+
+    def _chunk_export(self, lines):
+        """
+        Joins the lines of `export_chunk_size` rows to a single chunk.
+        """
+        chunk = []
+        for line in lines:
+            chunk.append(line)
+            if len(chunk) >= self.export_chunk_size:
+                yield ''.join(chunk)
+                chunk = []
+        if chunk:
+            yield ''.join(chunk)
+
+    def _export_csv(self, fields, rows):
+        writer = csv.writer(_Echo())
+        yield writer.writerow(fields)
+        for row in rows:
+            yield writer.writerow(row)
+
+    def _export_jsonl(self, fields, rows):
+        encoder = DjangoJSONEncoder()
+        for row in rows:
+            yield encoder.encode(dict(zip(fields, row))) + '\n'
 
 
 class DefaultActionsMixin(ViewAction, DeleteAction):
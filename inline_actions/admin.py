@@ -1,13 +1,63 @@
+import inspect
+import time
+from collections.abc import Iterator
+from html import escape
 from typing import Callable, List, Optional, Union
 
-from django.apps import apps
-from django.contrib import admin
-from django.http import HttpResponse
+from django.contrib import admin, messages
+from django.contrib.admin import helpers
+from django.contrib.admin.utils import unquote
+from django.core.exceptions import PermissionDenied, SuspiciousOperation
+from django.core.signing import BadSignature
+from django.db.models import Exists, OuterRef, Q, QuerySet
+from django.http import (
+    HttpResponseNotAllowed,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from django.http.response import HttpResponseBase, HttpResponseRedirectBase
 from django.shortcuts import redirect
-from django.urls import reverse
+from django.template.response import SimpleTemplateResponse, TemplateResponse
+from django.urls import path
+from django.utils.functional import SimpleLazyObject, empty
 from django.utils.safestring import mark_safe
 from django.utils.text import capfirst
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
+from django.utils.translation import ngettext
+
+from .budgets import QueryCounter, query_budgets_enforced
+from .cache import (
+    DEFAULT_TIMEOUT,
+    get_fragment_cache,
+    get_versions,
+    make_fragment_key,
+    watch_model,
+)
+from .metrics import get_admin_label
+from .metrics import registry as metrics_registry
+from .signals import (
+    ACTION_SIGNALS,
+    has_receivers,
+    inline_action_failed,
+    inline_action_finished,
+    inline_action_started,
+    inline_actions_rendered,
+)
+from .tokens import TOKEN_FIELD, get_action_tokens, make_token, parse_token
+from .utils import (
+    clear_request_cache,
+    fill_placeholders,
+    get_admin_url,
+    get_cached_template,
+    get_content_disposition,
+    get_current_request,
+    get_request_cache,
+    make_placeholder,
+    resolve_awaitable,
+    set_current_request,
+    split_placeholders,
+)
 
 
 class InlineActionException(Exception):
@@ -21,11 +71,138 @@ class ActionNotCallable(InlineActionException):
         self.action = action
 
 
+class QueryBudgetExceeded(InlineActionException):
+    pass
+
+
+class LazyParentObject(SimpleLazyObject):
+    """
+    Parent object passed to inline actions, which is only loaded on first use.
+
+    The model and the object id are known upfront, so that e.g. the redirect
+    back to the change form does not require the object to be loaded.
+    """
+
+    def __init__(self, func, model, object_id):
+        self.__dict__['_parent_model'] = model
+        self.__dict__['_parent_object_id'] = object_id
+        super().__init__(func)
+
+
+# annotation carrying the result of the `visible_if` condition of an action
+VISIBILITY_FIELD = 'inline_action_{}_visible'
+
+
+def get_visibility_condition(func):
+    """
+    Returns the `visible_if` condition of `func` as `Q` object or `None`.
+
+    The condition can be given as `Q` object or as a dict of field lookups.
+    """
+    condition = getattr(func, 'visible_if', None)
+    if condition is None or isinstance(condition, Q):
+        return condition
+    return Q(**condition)
+
+
+class ActionDescriptor:
+    """
+    Precompiled, per admin class information required to render an action.
+
+    Static labels, css classes, permissions and the token prefix are resolved
+    once. Per-object handlers
+    (`get_<action>_label` / `get_<action>_css`) and their batched variants
+    (`get_<action>_labels` / `get_<action>_css_classes`) are referenced by
+    attribute name, so that they are still looked up on the admin instance.
+    """
+
+    __slots__ = (
+        'name',
+        'label',
+        'css_classes',
+        'label_handler',
+        'css_handler',
+        'labels_handler',
+        'css_classes_handler',
+        'dynamic_label',
+        'dynamic_css_classes',
+        'allowed_permissions',
+        'visibility_field',
+        'ajax',
+        'token_prefix',
+    )
+
+    def __init__(self, model_admin_class, action_name):
+        func = getattr(model_admin_class, action_name, None)
+        if not func:
+            raise RuntimeError("Could not find action `{}`".format(action_name))
+
+        name = func.__name__
+        self.name = name
+        self.label = getattr(func, 'short_description', None)
+        if self.label is None:
+            self.label = capfirst(name.replace('_', ' '))
+        self.css_classes = getattr(func, 'css_classes', '')
+
+        self.label_handler = self._get_handler(model_admin_class, name, 'label')
+        self.css_handler = self._get_handler(model_admin_class, name, 'css')
+        self.labels_handler = self._get_handler(model_admin_class, name, 'labels')
+        self.css_classes_handler = self._get_handler(
+            model_admin_class, name, 'css_classes'
+        )
+        self.dynamic_label = bool(self.label_handler or self.labels_handler)
+        self.dynamic_css_classes = bool(self.css_handler or self.css_classes_handler)
+        self.allowed_permissions = tuple(getattr(func, 'allowed_permissions', ()))
+        # whether `inline_actions.js` executes the action using the json
+        # endpoint, opt-in as the action must not return a page or a file
+        self.ajax = getattr(func, 'ajax', False)
+        self.visibility_field = None
+        if get_visibility_condition(func) is not None:
+            self.visibility_field = VISIBILITY_FIELD.format(name)
+
+        # If the form is submitted, we have no information about the
+        # requested action.
+        # Hence we need all data to be encoded in the (signed) token.
+        self.token_prefix = '{}:{}:'.format(
+            model_admin_class._get_admin_key(model_admin_class),
+            name,
+        )
+
+    @staticmethod
+    def _get_handler(model_admin_class, name, suffix):
+        handler = 'get_{}_{}'.format(name, suffix)
+        if callable(getattr(model_admin_class, handler, None)):
+            return handler
+        return None
+
+
 class BaseInlineActionsMixin:
     INLINE_MODEL_ADMIN = 'inline'
     MODEL_ADMIN = 'admin'
 
     inline_actions: Optional[List[Union[str, Callable]]] = []
+    inline_actions_template: Optional[str] = None
+
+    # opt-in cache of the rendered actions per object
+    inline_actions_cache: bool = False
+    inline_actions_cache_alias: Optional[str] = None
+    inline_actions_cache_timeout: Optional[int] = DEFAULT_TIMEOUT
+    inline_actions_cache_version_field: Optional[str] = None
+
+    # maximum number of queries for rendering the actions of a page and for
+    # executing an action (see `enforce_query_budgets`)
+    inline_actions_max_queries: Optional[int] = None
+    inline_actions_max_action_queries: Optional[int] = None
+
+    # collect call counts, latencies and render times in `metrics.registry`
+    inline_actions_metrics: bool = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.inline_actions_cache:
+            watch_model(self.model, self.inline_actions_cache_alias)
+        if self.inline_actions_metrics:
+            metrics_registry.connect(type(self))
 
     def get_inline_actions(self, request, obj=None):
         """
@@ -36,11 +213,61 @@ class BaseInlineActionsMixin:
         if self.inline_actions is None:
             return []
 
+        # callers are allowed to extend the list, so we hand out a copy
+        return list(self._get_class_inline_actions())
+
+    @classmethod
+    def _get_class_inline_actions(cls):
+        """
+        Returns the actions defined by `inline_actions` on this class and all
+        parent classes.
+        """
+        return cls._get_inline_actions_cache()[1]
+
+    @classmethod
+    def _get_action_descriptors(cls):
+        """
+        Returns the mapping of action names to their `ActionDescriptor`.
+
+        Descriptors are compiled on first use and share their lifetime with
+        the cached class actions.
+        """
+        return cls._get_inline_actions_cache()[2]
+
+    @classmethod
+    def _get_action_descriptor(cls, action_name):
+        """
+        Returns the `ActionDescriptor` for `action_name` and compiles it if needed.
+        """
+        descriptors = cls._get_action_descriptors()
+        try:
+            return descriptors[action_name]
+        except KeyError:
+            descriptor = descriptors[action_name] = ActionDescriptor(cls, action_name)
+            return descriptor
+
+    @classmethod
+    def _get_inline_actions_cache(cls):
+        """
+        Returns a tuple of `(cache_key, class actions, action descriptors)`.
+
+        The class actions only depend on the class hierarchy, so they are
+        computed once per class and rebuilt whenever `inline_actions` is
+        reassigned on any class of the MRO.
+        """
+        cache_key = tuple(klass.__dict__.get('inline_actions') for klass in cls.__mro__)
+        cached = cls.__dict__.get('_inline_actions_cache')
+        if cached is not None and cached[0] == cache_key:
+            return cached
+        return cls._build_inline_actions_cache(cache_key)
+
+    @classmethod
+    def _build_inline_actions_cache(cls, cache_key):
         actions = []
 
         # Gather actions from the inline admin and all parent classes,
         # starting with self and working back up.
-        for klass in self.__class__.mro()[::-1]:
+        for klass in cls.mro()[::-1]:
             class_actions = getattr(klass, 'inline_actions', [])
             # Avoid trying to iterate over None
             if not class_actions:
@@ -50,7 +277,290 @@ class BaseInlineActionsMixin:
                 if action not in actions:
                     actions.append(action)
 
-        return actions
+        cls._inline_actions_cache = (cache_key, tuple(actions), {})
+        return cls._inline_actions_cache
+
+    @classmethod
+    def _get_queryset_hints(cls):
+        """
+        Returns a tuple of `(select_related, prefetch_related, visibility)`
+        declared by the actions of this class.
+
+        `visibility` maps the names of actions with `visible_if` to their
+        condition as `Q` object. Like `ActionDescriptor.name`, the name is the
+        one of the function, even if it is assigned to a different attribute.
+        Actions might be added dynamically by `get_inline_actions`, so the
+        declarations of all methods are collected once per class. Overridden
+        methods only contribute the declarations of the method resolved for
+        this class.
+        """
+        cached = cls.__dict__.get('_inline_actions_queryset_hints')
+        if cached is not None:
+            return cached
+
+        names = dict.fromkeys(
+            name for klass in cls.__mro__[::-1] for name in vars(klass)
+        )
+        select_related = []
+        prefetch_related = []
+        visibility = {}
+        for name in names:
+            func = getattr(cls, name, None)
+            if not inspect.isfunction(func):
+                continue
+            select_related.extend(getattr(func, 'select_related', ()))
+            prefetch_related.extend(getattr(func, 'prefetch_related', ()))
+            condition = get_visibility_condition(func)
+            if condition is not None:
+                visibility[func.__name__] = condition
+
+        # remove duplicates, but keep the order
+        cls._inline_actions_queryset_hints = (
+            tuple(dict.fromkeys(select_related)),
+            tuple(dict.fromkeys(prefetch_related)),
+            visibility,
+        )
+        return cls._inline_actions_queryset_hints
+
+    def get_queryset(self, request):
+        """
+        Applies the `select_related` and `prefetch_related` lookups declared
+        by the actions, so that rendering them does not query related objects
+        per row.
+        """
+        queryset = super().get_queryset(request)
+        select_related, prefetch_related, visibility = self._get_queryset_hints()
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        prefetch_related = [
+            lookup
+            for lookup in prefetch_related
+            if lookup not in queryset._prefetch_related_lookups
+        ]
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        return queryset
+
+    def _annotate_inline_actions_visibility(self, queryset):
+        """
+        Annotates the `visible_if` conditions of all actions to `queryset`.
+
+        Only the querysets of rendered rows are annotated, i.e. the page of
+        the changelist and the objects of an inline formset.
+        """
+        visibility = self._get_queryset_hints()[2]
+        if not visibility:
+            return queryset
+        # a subquery per condition, as joining conditions on to-many relations
+        # would duplicate the rows
+        manager = self.model._default_manager
+        return queryset.annotate(
+            **{
+                VISIBILITY_FIELD.format(name): Exists(
+                    manager.filter(condition, pk=OuterRef('pk'))
+                )
+                for name, condition in visibility.items()
+            }
+        )
+
+    def _is_inline_action_visible(self, request, action, obj):
+        """
+        Returns whether the `visible_if` condition of `action` holds for `obj`.
+
+        The condition is read from the annotation added by
+        `_annotate_inline_actions_visibility` and only queried, if `obj` has
+        been loaded otherwise.
+        """
+        try:
+            return getattr(obj, action.visibility_field)
+        except AttributeError:
+            pass
+
+        cache = get_request_cache(request)
+        key = (self, 'visible', action.name, obj.pk)
+        try:
+            return cache[key]
+        except KeyError:
+            condition = self._get_queryset_hints()[2][action.name]
+            queryset = self.model._default_manager.filter(condition, pk=obj.pk)
+            visible = cache[key] = queryset.exists()
+            return visible
+
+    def _is_inline_action_available(self, request, action, obj):
+        """
+        Returns whether `action` is rendered for `obj`, i.e. its
+        `allowed_permissions` are granted and its `visible_if` condition holds.
+        """
+        if action.allowed_permissions and not all(
+            self.has_inline_action_permission(request, permission, obj)
+            for permission in action.allowed_permissions
+        ):
+            return False
+        return action.visibility_field is None or bool(
+            self._is_inline_action_visible(request, action, obj)
+        )
+
+    def _get_available_objects(self, request, action_name, objs):
+        """
+        Returns the objects of `objs`, for which the action named
+        `action_name` is rendered.
+        """
+        actions_by_pk = self.get_inline_actions_for_objects(request, objs)
+        self._prefetch_inline_action_permissions(request, objs, actions_by_pk)
+
+        available = []
+        for obj in objs:
+            for name in actions_by_pk.get(obj.pk, ()):
+                action = self._get_action_descriptor(name)
+                if action.name == action_name and self._is_inline_action_available(
+                    request, action, obj
+                ):
+                    available.append(obj)
+                    break
+        return available
+
+    def get_inline_actions_for_objects(self, request, objs):
+        """
+        Returns a mapping of `obj.pk` to the list of actions for all `objs`.
+
+        It is called once for all objects of the current changelist page or
+        inline formset. Override it to compute the actions of all rows at once,
+        e.g. using a single query. By default, `get_inline_actions` is called
+        for every object.
+        """
+        return {obj.pk: self.get_inline_actions(request, obj) for obj in objs}
+
+    def _set_inline_actions_objects(self, request, objs):
+        """
+        Registers the objects, which are about to be rendered.
+
+        The actions for these objects are computed lazily on the first call
+        to `render_inline_actions`.
+        """
+        cache = get_request_cache(request)
+        cache[(self, 'objects')] = objs
+        cache.pop((self, 'actions'), None)
+
+    def _get_object_inline_actions(self, request, obj):
+        """
+        Returns the actions for `obj` as computed by
+        `get_inline_actions_for_objects` and falls back to `get_inline_actions`.
+        """
+        cache = get_request_cache(request)
+        actions_by_pk = cache.get((self, 'actions'))
+        if actions_by_pk is None:
+            objs = cache.pop((self, 'objects'), None)
+            if objs is not None:
+                actions_by_pk = self.get_inline_actions_for_objects(request, objs)
+                cache[(self, 'actions')] = actions_by_pk
+                self._prefetch_inline_action_permissions(request, objs, actions_by_pk)
+                self._prefetch_inline_action_values(request, objs, actions_by_pk)
+
+        if actions_by_pk is not None and obj.pk in actions_by_pk:
+            return actions_by_pk[obj.pk]
+        return self.get_inline_actions(request, obj)
+
+    def has_inline_action_permission(self, request, permission, obj=None):
+        """
+        Returns whether `has_<permission>_permission` is granted for `obj`.
+
+        The result is cached for the lifetime of the current request.
+        """
+        cache = get_request_cache(request)
+        key = (self, 'permission', permission, None if obj is None else obj.pk)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+
+        has_permission = getattr(self, 'has_{}_permission'.format(permission))
+        if obj is None:
+            result = cache[key] = has_permission(request)
+        else:
+            result = cache[key] = has_permission(request, obj)
+        return result
+
+    def get_inline_action_permissions(self, request, permission, objs):
+        """
+        Returns a mapping of `obj.pk` to whether `permission` is granted.
+
+        It is called once per permission for all objects of the current page,
+        which are affected by an action with `allowed_permissions`.
+        Override it to check object permissions using a single backend call.
+        By default, `has_inline_action_permission` is used for every object.
+        """
+        return {
+            obj.pk: self.has_inline_action_permission(request, permission, obj)
+            for obj in objs
+        }
+
+    def _prefetch_inline_action_permissions(self, request, objs, actions_by_pk):
+        """
+        Resolves the `allowed_permissions` of all actions for `objs` using
+        `get_inline_action_permissions`.
+        """
+        objs_by_permission = {}
+        for obj in objs:
+            for action_name in actions_by_pk.get(obj.pk, ()):
+                action = self._get_action_descriptor(action_name)
+                for permission in action.allowed_permissions:
+                    objs_by_permission.setdefault(permission, []).append(obj)
+
+        for permission, permission_objs in objs_by_permission.items():
+            self._prefetch_inline_action_permission(
+                request, permission, permission_objs
+            )
+
+    def _prefetch_inline_action_permission(self, request, permission, objs):
+        """
+        Resolves `permission` for all `objs`, which have not been checked yet,
+        using a single call of `get_inline_action_permissions`.
+        """
+        cache = get_request_cache(request)
+        objs = [
+            obj for obj in objs if (self, 'permission', permission, obj.pk) not in cache
+        ]
+        if not objs:
+            return
+        permissions = self.get_inline_action_permissions(request, permission, objs)
+        for pk, has_permission in permissions.items():
+            cache[(self, 'permission', permission, pk)] = has_permission
+
+    def _prefetch_inline_action_values(self, request, objs, actions_by_pk):
+        """
+        Calls the batched label and css handlers
+        (`get_<action>_labels` / `get_<action>_css_classes`) once for all
+        `objs` having the action.
+        """
+        objs_by_handler = {}
+        for obj in objs:
+            for action_name in actions_by_pk.get(obj.pk, ()):
+                action = self._get_action_descriptor(action_name)
+                for handler in (action.labels_handler, action.css_classes_handler):
+                    if handler is not None:
+                        objs_by_handler.setdefault(handler, []).append(obj)
+
+        cache = get_request_cache(request)
+        for handler, handler_objs in objs_by_handler.items():
+            values = getattr(self, handler)(request, handler_objs)
+            cache[(self, 'batched', handler)] = values
+
+    def _get_inline_action_value(self, request, obj, batched_handler, handler, default):
+        """
+        Returns the label or css classes of an action for `obj`.
+
+        The value computed by the batched handler is preferred, followed by
+        the per-object handler and the static `default`.
+        """
+        if batched_handler is not None:
+            values = get_request_cache(request).get((self, 'batched', batched_handler))
+            if values is None:  # `obj` has not been registered
+                values = getattr(self, batched_handler)(request, [obj])
+            if obj.pk in values:
+                return values[obj.pk]
+        if handler is not None:
+            return getattr(self, handler)(obj=obj)
+        return default
 
     def get_readonly_fields(self, request, obj=None):
         fields = super().get_readonly_fields(request, obj)
@@ -60,6 +570,32 @@ class BaseInlineActionsMixin:
             fields.append('render_inline_actions')
         return fields
 
+    @staticmethod
+    def _get_admin_key(model_admin_class):
+        """
+        Returns the key used in action tokens to identify the admin.
+
+        Inlines are identified by their lowercased class name, which is
+        required to distinguish between multiple inlines for the same model.
+        The model admin itself uses an empty key.
+        """
+        if issubclass(model_admin_class, admin.options.InlineModelAdmin):
+            return model_admin_class.__name__.lower()
+        return ''
+
+    def _get_token_scope(self):
+        """
+        Returns the scope the tokens of this admin are signed for.
+
+        Tokens are handled by the model admin, also those of its inlines, so
+        they are bound to the admin site and the model of the model admin.
+        """
+        if isinstance(self, admin.options.InlineModelAdmin):
+            opts = self.parent_model._meta
+        else:
+            opts = self.model._meta
+        return '{}:{}'.format(self.admin_site.name, opts.label_lower)
+
     def _get_admin_type(self, model_admin=None):
         """
         Returns wether this is an InlineAdmin or not.
@@ -70,65 +606,260 @@ class BaseInlineActionsMixin:
             return self.INLINE_MODEL_ADMIN
         return self.MODEL_ADMIN
 
-    def render_inline_actions(self, obj=None):  # NOQA: C901
+    def render_inline_actions(self, obj=None):
         """
         Renders all defined inline actions as html.
         """
         if not (obj and obj.pk):
             return ''
 
-        buttons = []
-        for action_name in self.get_inline_actions(self._request, obj):
-            action_func = getattr(self, action_name, None)
-            if not action_func:
-                raise RuntimeError("Could not find action `{}`".format(action_name))
+        request = get_current_request()
+        timings = get_request_cache(request).get('render_timings')
+        if timings is None:
+            return self._render_within_budget(request, obj)
+
+        started = time.perf_counter()
+        html = self._render_within_budget(request, obj)
+        rows, duration = timings.get(self, (0, 0.0))
+        timings[self] = (rows + 1, duration + time.perf_counter() - started)
+        return html
+
+    render_inline_actions.short_description = _("Actions")  # type: ignore
+    render_inline_actions.allow_tags = True  # type: ignore
+
+    def _render_within_budget(self, request, obj):
+        """
+        Returns the rendered actions of `obj` and checks the query budget.
+        """
+        budget = self.inline_actions_max_queries
+        if budget is None or not query_budgets_enforced():
+            return self._get_inline_actions_html(request, obj)
+
+        # the budget applies to all rows rendered by this admin in this request
+        counter = get_request_cache(request).setdefault(
+            (self, 'queries'), QueryCounter(self)
+        )
+        with counter:
+            html = self._get_inline_actions_html(request, obj)
+        self._check_query_budget(
+            counter,
+            budget,
+            "Rendering the inline actions of `{}`".format(type(self).__name__),
+        )
+        return html
+
+    def _get_inline_actions_html(self, request, obj):
+        """
+        Returns the rendered actions of `obj`, using the cache if enabled.
+        """
+        if not self.inline_actions_cache:
+            return self._render_inline_actions(request, obj)
+
+        key, html = self._get_cached_fragment(request, obj)
+        if html is None:
+            html = self._render_inline_actions(request, obj)
+            get_fragment_cache(self.inline_actions_cache_alias).set(
+                key, str(html), self.inline_actions_cache_timeout
+            )
+        return mark_safe(html)
+
+    @staticmethod
+    def _check_query_budget(counter, budget, description):
+        """
+        Raises `QueryBudgetExceeded` if `counter` counted more than `budget` queries.
+        """
+        if counter.total > budget:
+            raise QueryBudgetExceeded(
+                "{} executed {} queries, exceeding the budget of {}:\n{}".format(
+                    description, counter.total, budget, counter.report()
+                )
+            )
+
+    def _render_inline_actions(self, request, obj):
+        """
+        Renders the actions of `obj`.
+
+        Rows with the same actions, labels and css classes share the html
+        rendered by the template, only the tokens are inserted per row.
+        """
+        descriptors = self._get_action_descriptors()
+
+        actions = []
+        for action_name in self._get_object_inline_actions(request, obj):
+            action = descriptors.get(action_name)
+            if action is None:
+                action = self._get_action_descriptor(action_name)
+
+            if not self._is_inline_action_available(request, action, obj):
+                continue
 
             # Add per-object label support
-            action_name = action_func.__name__
-            label_handler = getattr(self, 'get_{}_label'.format(action_name), None)
-            if callable(label_handler):
-                description = label_handler(obj=obj)
+            if action.dynamic_label:
+                description = self._get_inline_action_value(
+                    request,
+                    obj,
+                    action.labels_handler,
+                    action.label_handler,
+                    action.label,
+                )
             else:
-                try:
-                    description = action_func.short_description
-                except AttributeError:
-                    description = capfirst(action_name.replace('_', ' '))
+                description = action.label
 
             # Add per-object css classes support
-            css_handler = getattr(self, 'get_{}_css'.format(action_name), None)
-            if callable(css_handler):
-                css_classes = css_handler(obj=obj)
-            else:
-                try:
-                    css_classes = action_func.css_classes
-                except AttributeError:
-                    css_classes = ''
-
-            # If the form is submitted, we have no information about the
-            # requested action.
-            # Hence we need all data to be encoded using the action name.
-            action_data = [
-                # required to distinguish between multiple inlines for the same model
-                self.__class__.__name__.lower(),
-                self._get_admin_type(),
-                action_name,
-                obj._meta.app_label,
-                obj._meta.model_name,
-                str(obj.pk),
-            ]
-            buttons.append(
-                '<input type="submit" name="{}" value="{}" class="{}">'.format(
-                    '_action__{}'.format('__'.join(action_data)),
-                    description,
-                    css_classes,
+            if action.dynamic_css_classes:
+                css_classes = self._get_inline_action_value(
+                    request,
+                    obj,
+                    action.css_classes_handler,
+                    action.css_handler,
+                    action.css_classes,
                 )
+            else:
+                css_classes = action.css_classes
+
+            actions.append((action, description, css_classes))
+
+        parts = self._get_action_bar_parts(request, actions)
+        scope = self._get_token_scope()
+        # tokens are plain strings, the stdlib escapes them much faster than
+        # django's lazy aware `escape`
+        tokens = [
+            escape(make_token(action.token_prefix, obj.pk, scope))
+            for action, __, __ in actions
+        ]
+        return mark_safe(fill_placeholders(parts, tokens))
+
+    def _get_action_bar_parts(self, request, actions):
+        """
+        Returns the rendered template for `actions` split at the placeholders
+        of the tokens (see `split_placeholders`).
+
+        The template is only rendered once per request for every distinct
+        combination of actions, labels and css classes.
+        """
+        # static labels and css classes are identified by the action itself
+        signature = tuple(
+            (
+                action.name,
+                description if action.dynamic_label else None,
+                css_classes if action.dynamic_css_classes else None,
             )
-        return mark_safe(
-            '<div class="submit_row inline_actions">{}</div>'.format(''.join(buttons))
+            for action, description, css_classes in actions
         )
+        cache = get_request_cache(request).setdefault((self, 'action_bars'), {})
+        try:
+            return cache[signature]
+        except KeyError:
+            pass
 
-    render_inline_actions.short_description = _("Actions")  # type: ignore
-    render_inline_actions.allow_tags = True  # type: ignore
+        buttons = [
+            {
+                'name': action.name,
+                'label': description,
+                'css_classes': css_classes,
+                'token': make_placeholder(index),
+                'ajax': action.ajax,
+            }
+            for index, (action, description, css_classes) in enumerate(actions)
+        ]
+        template = get_cached_template(self.get_inline_actions_template_names())
+        html = template.render(
+            {
+                'actions': buttons,
+                'token_field': TOKEN_FIELD,
+                'execute_url': get_request_cache(request).get('execute_url'),
+            }
+        )
+        parts = cache[signature] = split_placeholders(html)
+        return parts
+
+    def get_inline_actions_template_names(self):
+        """
+        Returns the templates, which are tried to render the actions of a row.
+
+        The template can be overridden per admin (`inline_actions_template`),
+        per model, per app or globally.
+        """
+        opts = self.model._meta
+        template_names = [
+            'inline_actions/{}/{}/inline_actions.html'.format(
+                opts.app_label, opts.model_name
+            ),
+            'inline_actions/{}/inline_actions.html'.format(opts.app_label),
+            'inline_actions/inline_actions.html',
+        ]
+        if self.inline_actions_template:
+            template_names.insert(0, self.inline_actions_template)
+        return template_names
+
+    def get_inline_actions_cache_signature(self, request):
+        """
+        Returns the part of the fragment cache key, which identifies the
+        permissions of the current user.
+
+        Rows are cached per combination of permissions, so users with the same
+        permissions share the cached fragments. Override it, if the actions
+        depend on anything else about the user.
+        """
+        user = getattr(request, 'user', None)
+        if user is None:
+            return None
+        if user.is_active and user.is_superuser:
+            return 'superuser'
+        return tuple(sorted(user.get_all_permissions()))
+
+    def _get_cached_fragment(self, request, obj):
+        """
+        Returns a tuple of `(cache key, cached html or None)` for `obj`.
+
+        The fragments of all registered objects are fetched at once. Only the
+        actions of objects without a cached fragment are computed afterwards.
+        """
+        cache = get_request_cache(request)
+        fragments = cache.setdefault((self, 'fragments'), {})
+        if obj.pk not in fragments:
+            objs = cache.get((self, 'objects'))
+            if objs is not None:
+                objs = list(objs)
+                fragments.update(self._get_cached_fragments(request, objs))
+                cache[(self, 'objects')] = [
+                    obj for obj in objs if fragments[obj.pk][1] is None
+                ]
+            if obj.pk not in fragments:
+                fragments.update(self._get_cached_fragments(request, [obj]))
+        return fragments[obj.pk]
+
+    def _get_cached_fragments(self, request, objs):
+        fragment_cache = get_fragment_cache(self.inline_actions_cache_alias)
+        versions = get_versions(fragment_cache, self.model, [obj.pk for obj in objs])
+
+        request_cache = get_request_cache(request)
+        try:
+            signature = request_cache[(self, 'cache_signature')]
+        except KeyError:
+            signature = request_cache[(self, 'cache_signature')] = (
+                self.get_inline_actions_cache_signature(request)
+            )
+
+        key_parts = (
+            self._get_token_scope(),
+            type(self).__module__,
+            type(self).__qualname__,
+            signature,
+            get_language(),
+            make_token('', ''),  # changes with `SECRET_KEY`
+            request_cache.get('execute_url'),
+        )
+        version_field = self.inline_actions_cache_version_field
+        keys = {}
+        for obj in objs:
+            version = versions[obj.pk]
+            if version_field:
+                version = (version, getattr(obj, version_field))
+            keys[obj.pk] = make_fragment_key(*key_parts, obj.pk, version)
+
+        cached = fragment_cache.get_many(list(keys.values()))
+        return {pk: (key, cached.get(key)) for pk, key in keys.items()}
 
 
 class InlineActionsMixin(BaseInlineActionsMixin):
@@ -140,9 +871,30 @@ class InlineActionsMixin(BaseInlineActionsMixin):
     render_inline_actions.short_description = _("Actions")  # type: ignore
     render_inline_actions.allow_tags = True  # type: ignore
 
+    def get_formset(self, request, obj=None, **kwargs):
+        formset = super().get_formset(request, obj, **kwargs)
+        if self.inline_actions is None:  # is it explicitly disabled?
+            return formset
+
+        model_admin = self
+
+        class InlineActionsFormSet(formset):
+            def get_queryset(self):
+                if not hasattr(self, '_inline_actions_queryset'):
+                    queryset = model_admin._annotate_inline_actions_visibility(
+                        super().get_queryset()
+                    )
+                    # compute the actions of all rows at once
+                    model_admin._set_inline_actions_objects(request, queryset)
+                    self._inline_actions_queryset = queryset
+                return self._inline_actions_queryset
+
+        InlineActionsFormSet.__name__ = formset.__name__
+        return InlineActionsFormSet
+
     def get_fields(self, request, obj=None):
-        # store `request` for `get_inline_actions`
-        self._request = request
+        # bind `request` to the current context for `render_inline_actions`
+        set_current_request(request)
 
         fields = super().get_fields(request, obj)
         if self.inline_actions is not None:  # is it explicitly disabled?
@@ -155,10 +907,203 @@ class InlineActionsMixin(BaseInlineActionsMixin):
 class InlineActionsModelAdminMixin(BaseInlineActionsMixin):
     class Media:
         css = {"all": ("inline_actions/css/inline_actions.css",)}
+        js = ("inline_actions/js/inline_actions.js",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # inlines are only instantiated per request,
+        # but their objects might be changed at any time
+        for inline_class in self.inlines:
+            if getattr(inline_class, 'inline_actions_cache', False):
+                watch_model(inline_class.model, inline_class.inline_actions_cache_alias)
+            if getattr(inline_class, 'inline_actions_metrics', False):
+                metrics_registry.connect(inline_class)
+
+    def get_urls(self):
+        info = self.model._meta.app_label, self.model._meta.model_name
+        urls = [
+            path(
+                'inline-actions/',
+                self.admin_site.admin_view(self.inline_actions_diagnostics_view),
+                name='{}_{}_inline_actions_diagnostics'.format(*info),
+            ),
+            path(
+                'inline-actions/execute/',
+                self.admin_site.admin_view(self.inline_actions_execute_view),
+                name='{}_{}_inline_actions_execute'.format(*info),
+            ),
+            path(
+                'inline-actions/execute/<path:object_id>/',
+                self.admin_site.admin_view(self.inline_actions_execute_view),
+                name='{}_{}_inline_actions_execute'.format(*info),
+            ),
+        ]
+        return urls + super().get_urls()
+
+    def inline_actions_execute_view(self, request, object_id=None):
+        """
+        Executes the action of the posted token and returns the result as json.
+
+        It is used by `inline_actions.js` for actions with `ajax = True`
+        instead of submitting the changelist or change form (`object_id`),
+        which requires the whole page to be rendered again. The json contains a
+        `redirect` url, if the action redirected elsewhere, and the updated
+        action bar of the object (`actions`), if requested by
+        `_inline_actions_render`. The `messages` are only consumed along with
+        the updated actions, otherwise they are kept for the next page. Any
+        other response of the action, e.g. an intermediate form, is returned
+        as is.
+        """
+        if request.method != 'POST':
+            return HttpResponseNotAllowed(['POST'])
+
+        # bind `request` to the current context for `render_inline_actions`
+        set_current_request(request)
+        get_request_cache(request)['execute_url'] = self._get_execute_url(object_id)
+
+        resolved = self._resolve_action(request, object_id)
+        if resolved is None:
+            raise SuspiciousOperation("No inline action has been triggered.")
+        model_admin, action, obj, parent_obj = resolved
+        response = self._execute_action(request, model_admin, action, obj, parent_obj)
+        if not isinstance(response, HttpResponseRedirectBase):
+            return response
+
+        if parent_obj is None:
+            back_url = get_admin_url(
+                self.admin_site.name, self.model._meta, 'changelist'
+            )
+        else:
+            back_url = self._get_parent_change_url(parent_obj)
+        redirect_url = response.url
+        if redirect_url.split('?', 1)[0] == back_url:
+            redirect_url = None
+
+        actions = None
+        if (
+            redirect_url is None
+            and '_inline_actions_render' in request.POST
+            and not isinstance(obj, (list, QuerySet))
+        ):
+            actions = self._render_updated_actions(request, model_admin, obj)
+
+        # the messages are shown by the next page, if it is loaded anyway
+        action_messages = []
+        if actions is not None:
+            action_messages = [
+                {
+                    'level': message.level,
+                    'tags': message.tags,
+                    'message': str(message),
+                }
+                for message in messages.get_messages(request)
+            ]
+
+        return JsonResponse(
+            {
+                'status': 'ok',
+                'messages': action_messages,
+                'redirect': redirect_url,
+                'actions': actions,
+            }
+        )
+
+    def _get_execute_url(self, object_id=None):
+        return get_admin_url(
+            self.admin_site.name, self.model._meta, 'inline_actions_execute', object_id
+        )
+
+    def _render_updated_actions(self, request, model_admin, obj):
+        """
+        Returns the action bar of `obj` rendered again after executing an
+        action, `None` if it does not exist anymore.
+        """
+        # e.g. permissions might have been changed by the action
+        clear_request_cache(request, keep=('execute_url',))
+        obj = model_admin.get_queryset(request).filter(pk=obj.pk).first()
+        if obj is None:
+            return None
+        return str(model_admin._render_within_budget(request, obj))
+
+    def inline_actions_diagnostics_view(self, request):
+        """
+        Lists the actions of all admins of this admin site and their metrics.
+
+        Only accessible by staff users.
+        """
+        context = dict(
+            self.admin_site.each_context(request),
+            title=_("Inline actions"),
+            opts=self.model._meta,
+            admins=self._get_inline_actions_diagnostics(),
+        )
+        return TemplateResponse(request, 'inline_actions/diagnostics.html', context)
+
+    def _get_inline_actions_diagnostics(self):
+        diagnostics = []
+        for model_admin in self.admin_site._registry.values():
+            if not isinstance(model_admin, InlineActionsModelAdminMixin):
+                continue
+            diagnostics.append(
+                self._get_admin_diagnostics(type(model_admin), model_admin.model)
+            )
+            for inline_class in model_admin.inlines:
+                if issubclass(inline_class, BaseInlineActionsMixin):
+                    diagnostics.append(
+                        self._get_admin_diagnostics(inline_class, inline_class.model)
+                    )
+        return diagnostics
+
+    @staticmethod
+    def _get_admin_diagnostics(model_admin_class, model):
+        """
+        Returns the actions of `model_admin_class` and their metrics.
+
+        Actions, which are only added by `get_inline_actions`, are listed once
+        they have been executed.
+        """
+        admin_label = get_admin_label(model_admin_class)
+        action_names = [
+            getattr(action, '__name__', action)
+            for action in model_admin_class._get_class_inline_actions()
+        ]
+        action_names += [
+            name
+            for name in metrics_registry.get_action_names(admin_label)
+            if name not in action_names
+        ]
+
+        actions = []
+        for name in action_names:
+            func = getattr(model_admin_class, name, None)
+            stats = metrics_registry.get_action_stats(admin_label, name)
+            actions.append(
+                {
+                    'name': name,
+                    'label': getattr(func, 'short_description', ''),
+                    'allowed_permissions': getattr(func, 'allowed_permissions', ()),
+                    'bulk': getattr(func, 'bulk', False),
+                    'max_queries': getattr(
+                        func,
+                        'max_queries',
+                        model_admin_class.inline_actions_max_action_queries,
+                    ),
+                    'stats': stats,
+                    'p95': stats and stats.quantile(0.95),
+                }
+            )
+
+        return {
+            'label': admin_label,
+            'model': model._meta.label,
+            'metrics': model_admin_class.inline_actions_metrics,
+            'actions': actions,
+            'render_stats': metrics_registry.get_render_stats(admin_label),
+        }
 
     def get_list_display(self, request):
-        # store `request` for `get_inline_actions`
-        self._request = request
+        # bind `request` to the current context for `render_inline_actions`
+        set_current_request(request)
 
         fields = super().get_list_display(request)
         if self.inline_actions is not None:  # is it explicitly disabled?
@@ -167,9 +1112,21 @@ class InlineActionsModelAdminMixin(BaseInlineActionsMixin):
                 fields.append('render_inline_actions')
         return fields
 
+    def get_changelist_instance(self, request):
+        changelist = super().get_changelist_instance(request)
+        if self.inline_actions is not None:  # is it explicitly disabled?
+            if isinstance(changelist.result_list, QuerySet):
+                # only the rows of the current page, not yet evaluated
+                changelist.result_list = self._annotate_inline_actions_visibility(
+                    changelist.result_list
+                )
+            # compute the actions of all rows of the current page at once
+            self._set_inline_actions_objects(request, changelist.result_list)
+        return changelist
+
     def get_fields(self, request, obj=None):
-        # store `request` for `get_inline_actions`
-        self._request = request
+        # bind `request` to the current context for `render_inline_actions`
+        set_current_request(request)
 
         fields = super().get_fields(request, obj=obj)
         if not self.fields:
@@ -184,38 +1141,103 @@ class InlineActionsModelAdminMixin(BaseInlineActionsMixin):
         """
         Tries to execute the requested action and returns a `HttpResponse`.
 
+        `obj` might be a list of multiple selected objects, which is passed to
+        the action one by one, or a `QuerySet` for actions with `bulk = True`.
+
         raises
             ActionNotCallable - When action is not a function
+            PermissionDenied - When `allowed_permissions` are not granted
+            QueryBudgetExceeded - When the action exceeds `max_queries`
         """
-        # execute action
         func = getattr(model_admin, action, None)
+        budget = getattr(
+            func, 'max_queries', model_admin.inline_actions_max_action_queries
+        )
+        if not query_budgets_enforced():
+            budget = None
+        instrumented = has_receivers(*ACTION_SIGNALS)
+        if budget is None and not instrumented:
+            return self._run_action(request, model_admin, action, func, obj, parent_obj)
+
+        sender = type(model_admin)
+        info = {
+            'model_admin': model_admin,
+            'request': request,
+            'action': action,
+            'obj': obj,
+            'pk': None if isinstance(obj, (list, QuerySet)) else obj.pk,
+        }
+        inline_action_started.send(sender, **info)
+
+        # queries are only attributed to their source, if a budget is checked
+        counter = QueryCounter(model_admin if budget is not None else None)
+        started = time.perf_counter()
         try:
-            response = func(request, obj, parent_obj=parent_obj)
-        except TypeError as e:
-            raise ActionNotCallable(model_admin, action) from e
+            with counter:
+                response = self._run_action(
+                    request, model_admin, action, func, obj, parent_obj
+                )
+            if budget is not None:
+                self._check_query_budget(
+                    counter,
+                    budget,
+                    "Executing the inline action `{}` of `{}`".format(
+                        action, sender.__name__
+                    ),
+                )
+        except Exception as e:
+            inline_action_failed.send(
+                sender,
+                duration=time.perf_counter() - started,
+                queries=counter.total,
+                exception=e,
+                **info,
+            )
+            raise
+
+        inline_action_finished.send(
+            sender,
+            duration=time.perf_counter() - started,
+            queries=counter.total,
+            response_type=type(response),
+            **info,
+        )
+        return response
+
+    def _run_action(self, request, model_admin, action, func, obj, parent_obj):
+        """
+        Executes the action and returns the response or a redirect back.
+        """
+        opts = model_admin.model._meta
+        if isinstance(obj, list):
+            self._check_action_permissions(request, model_admin, func, obj)
+            response = self._call_action_per_object(
+                request, model_admin, action, func, obj, parent_obj
+            )
+        elif isinstance(obj, QuerySet):
+            if getattr(func, 'allowed_permissions', ()):
+                # evaluates the queryset, which is reused by the action
+                self._check_action_permissions(request, model_admin, func, list(obj))
+            response = self._call_action(
+                request, model_admin, action, func, obj, parent_obj
+            )
+        else:
+            self._check_action_permissions(request, model_admin, func, [obj])
+            response = self._call_action(
+                request, model_admin, action, func, obj, parent_obj
+            )
 
         # we should receive an HttpResponse
-        if isinstance(response, HttpResponse):
+        if isinstance(response, HttpResponseBase):
             return response
 
         # otherwise redirect back
         if parent_obj is None:  # InlineActionsMixin.MODEL_ADMIN:
             # redirect to `changelist`
-            url = reverse(
-                'admin:{}_{}_changelist'.format(
-                    obj._meta.app_label,
-                    obj._meta.model_name,
-                ),
-            )
+            url = get_admin_url(self.admin_site.name, opts, 'changelist')
         else:
             # redirect to `changeform`
-            url = reverse(
-                'admin:{}_{}_change'.format(
-                    parent_obj._meta.app_label,
-                    parent_obj._meta.model_name,
-                ),
-                args=(parent_obj.pk,),
-            )
+            url = self._get_parent_change_url(parent_obj)
 
         # readd query string
         query = request.META['QUERY_STRING'] or request.GET.urlencode()
@@ -224,6 +1246,178 @@ class InlineActionsModelAdminMixin(BaseInlineActionsMixin):
 
         return redirect(url)
 
+    def _call_action_per_object(
+        self, request, model_admin, action, func, objs, parent_obj
+    ):
+        """
+        Calls the action once per object until it returns a response.
+
+        The remaining objects are skipped, which is reported as a warning.
+        """
+        for index, obj in enumerate(objs, start=1):
+            response = self._call_action(
+                request, model_admin, action, func, obj, parent_obj
+            )
+            if isinstance(response, HttpResponseBase):
+                skipped = len(objs) - index
+                if skipped:
+                    messages.warning(
+                        request,
+                        ngettext(
+                            "The action has not been applied to %(count)d "
+                            "more selected object.",
+                            "The action has not been applied to %(count)d "
+                            "more selected objects.",
+                            skipped,
+                        )
+                        % {'count': skipped},
+                        fail_silently=True,
+                    )
+                return response
+        return None
+
+    def _get_parent_change_url(self, parent_obj):
+        if isinstance(parent_obj, LazyParentObject) and parent_obj._wrapped is empty:
+            # the action did not use `parent_obj`, don't load it now
+            parent_opts = parent_obj._parent_model._meta
+            parent_pk = parent_obj._parent_object_id
+        else:
+            parent_opts = parent_obj._meta
+            parent_pk = parent_obj.pk
+        return get_admin_url(self.admin_site.name, parent_opts, 'change', parent_pk)
+
+    def _check_action_permissions(self, request, model_admin, func, objs):
+        """
+        Raises `PermissionDenied` if any of the `allowed_permissions` of `func`
+        is not granted for all `objs`.
+        """
+        for permission in getattr(func, 'allowed_permissions', ()):
+            permissions = model_admin.get_inline_action_permissions(
+                request, permission, objs
+            )
+            if not all(permissions.values()):
+                raise PermissionDenied
+
+    def _call_action(self, request, model_admin, action, func, obj, parent_obj):
+        """
+        Calls the action and returns its (awaited) result.
+        """
+        try:
+            response = func(request, obj, parent_obj=parent_obj)
+        except TypeError as e:
+            raise ActionNotCallable(model_admin, action) from e
+
+        # `async def` actions return an awaitable
+        if inspect.isawaitable(response):
+            response = resolve_awaitable(response)
+
+        # generators are streamed, e.g. by exports
+        if isinstance(response, Iterator):
+            response = self._get_streaming_response(func, obj, response)
+        return response
+
+    def _get_streaming_response(self, func, obj, content):
+        """
+        Returns a `StreamingHttpResponse` consuming the iterator `content`.
+
+        The `content_type` and `filename` (a string or a callable receiving
+        `obj`) are read from the action.
+        """
+        response = StreamingHttpResponse(
+            content,
+            content_type=getattr(func, 'content_type', 'application/octet-stream'),
+        )
+        filename = getattr(func, 'filename', None)
+        if callable(filename):
+            filename = filename(obj)
+        if filename:
+            response['Content-Disposition'] = get_content_disposition(filename)
+        return response
+
+    def _get_action_target(self, request, model_admin, action, object_pk):
+        """
+        Returns the object the action has been triggered for.
+
+        On the changelist, the action is applied to all selected rows, if the
+        triggering row is part of the selection. Selected rows, for which the
+        action is not rendered, are left out. The selected objects are loaded
+        using a single query and returned as list. Actions with `bulk = True`
+        receive a lazy `QuerySet` of their targets instead.
+
+        raises
+            PermissionDenied - When the action is not available for any of the
+                selected rows
+        """
+        pks = [object_pk]
+        if model_admin is self:
+            selected = request.POST.getlist(helpers.ACTION_CHECKBOX_NAME)
+            if object_pk in selected:
+                pks = selected
+
+        queryset = model_admin.get_queryset(request)
+        bulk = getattr(getattr(model_admin, action, None), 'bulk', False)
+        if len(pks) > 1:
+            candidates = model_admin._annotate_inline_actions_visibility(
+                queryset.filter(pk__in=pks)
+            )
+            objs = model_admin._get_available_objects(request, action, list(candidates))
+            if not objs:
+                raise PermissionDenied
+            if not bulk:
+                return objs
+            pks = [obj.pk for obj in objs]
+
+        if bulk:
+            return queryset.filter(pk__in=pks)
+        return queryset.get(pk=object_pk)
+
+    def _get_action_admin(self, request, admin_key):
+        """
+        Returns the admin instance identified by `admin_key`.
+
+        Only the targeted inline is instantiated.
+
+        raises
+            SuspiciousOperation - When the inline is unknown
+            PermissionDenied - When the inline is not accessible
+        """
+        if not admin_key:
+            return self
+
+        if hasattr(self, 'get_inlines'):
+            inlines = self.get_inlines(request, None)
+        else:  # pragma: no cover, django < 3.0
+            inlines = self.inlines
+        inline_class = self._get_inline_dispatch_map(inlines).get(admin_key)
+        if inline_class is None:
+            raise SuspiciousOperation("Unknown inline `{}`.".format(admin_key))
+
+        inline = inline_class(self.model, self.admin_site)
+        has_permission = getattr(
+            inline, 'has_view_or_change_permission', inline.has_change_permission
+        )
+        if not has_permission(request):
+            raise PermissionDenied
+        return inline
+
+    @classmethod
+    def _get_inline_dispatch_map(cls, inlines):
+        """
+        Returns a mapping of admin keys to the corresponding inline classes.
+
+        The mapping is built once and rebuilt, if a different list of inlines
+        is passed.
+        """
+        cached = cls.__dict__.get('_inline_dispatch_map')
+        if cached is not None and cached[0] is inlines:
+            return cached[1]
+
+        dispatch_map = {
+            cls._get_admin_key(inline_class): inline_class for inline_class in inlines
+        }
+        cls._inline_dispatch_map = (inlines, dispatch_map)
+        return dispatch_map
+
     def _handle_action(self, request, object_id=None):
         """
         Resolve and executes the action issued by the current request.
@@ -231,59 +1425,117 @@ class InlineActionsModelAdminMixin(BaseInlineActionsMixin):
 
         Returns `HttpResponse` or `None`
         """
-        all_actions = [
-            key for key in list(request.POST.keys()) if key.startswith('_action__')
-        ]
+        resolved = self._resolve_action(request, object_id)
+        if resolved is None:
+            return None
+        model_admin, action, obj, parent_obj = resolved
+        return self._execute_action(request, model_admin, action, obj, parent_obj)
+
+    def _resolve_action(self, request, object_id=None):
+        """
+        Returns a tuple of `(model_admin, action, obj, parent_obj)` for the
+        action issued by the current request or `None`.
+        """
+        tokens = get_action_tokens(request)
+        if not any(tokens):  # e.g. a regular save
+            return None
+        if len(tokens) > 1:
+            raise SuspiciousOperation(
+                "Multiple inline actions have been triggered simultaneously."
+            )
 
-        if request.method == 'POST' and all_actions:
-            assert len(all_actions) == 1
-            raw_action_name = all_actions[0].replace('_action__', '', 1)
+        # resolve action and target models
+        try:
+            admin_key, action, object_pk = parse_token(
+                tokens[0], self._get_token_scope()
+            )
+        except BadSignature as e:
+            raise SuspiciousOperation(str(e)) from e
 
-            # resolve action and target models
-            raw_action_parts = raw_action_name.split('__')
-            admin_class_name, admin_type = raw_action_parts[:2]
-            action, app_label, model_name, object_pk = raw_action_parts[2:]
+        parent_obj = None
+        if object_id is not None:
+            # only loaded, if the action uses it
+            parent_obj = self._get_lazy_parent_object(request, unquote(object_id))
 
-            model = apps.get_model(app_label=app_label, model_name=model_name)
-            parent_obj = self.get_object(request, object_id)
+        model_admin = self._get_action_admin(request, admin_key)
+        obj = self._get_action_target(request, model_admin, action, object_pk)
+        return model_admin, action, obj, parent_obj
 
-            # find action and execute
-            if admin_type == self.MODEL_ADMIN:
-                model_admin = self
-                obj = model_admin.get_queryset(request).get(pk=object_pk)
-                # parent_obj is None because `object_id` is None
+    def _get_lazy_parent_object(self, request, object_id):
+        """
+        Returns the object of the current change form as `LazyParentObject`.
 
-            else:
-                for inline in self.get_inline_instances(request):
-                    inline_class_name = inline.__class__.__name__.lower()
-                    matches_inline_class = inline_class_name == admin_class_name
-                    matches_model = inline.model == model
-
-                    if not matches_model or not matches_inline_class:
-                        continue
-                    model_admin = inline
-                obj = model_admin.get_queryset(request).get(pk=object_pk)
-
-            if model_admin:
-                return self._execute_action(
-                    request, model_admin, action, obj, parent_obj
-                )
-        return None
+        Once loaded, it is handed over to the next `get_object` call of the
+        same request instead of being fetched again.
+        """
+
+        def load():
+            obj = self.get_object(request, object_id)
+            get_request_cache(request)[(self, 'parent', object_id)] = obj
+            return obj
+
+        return LazyParentObject(load, self.model, object_id)
+
+    def get_object(self, request, object_id, from_field=None):
+        if from_field is None:
+            # reuse the parent object already loaded by an action
+            obj = get_request_cache(request).pop((self, 'parent', object_id), None)
+            if obj is not None:
+                return obj
+        return super().get_object(request, object_id, from_field)
 
     def changeform_view(self, request, object_id=None, form_url='', extra_context=None):
+        # bind `request` to the current context for `render_inline_actions`
+        set_current_request(request)
+        if object_id is not None:
+            get_request_cache(request)['execute_url'] = self._get_execute_url(object_id)
+
         # handle requested action if required
         response = self._handle_action(request, object_id=object_id)
         if response:
             return response
 
         # continue normally
-        return super().changeform_view(request, object_id, form_url, extra_context)
+        response = super().changeform_view(request, object_id, form_url, extra_context)
+        self._track_render_timings(request, response)
+        return response
 
     def changelist_view(self, request, extra_context=None):
+        # bind `request` to the current context for `render_inline_actions`
+        set_current_request(request)
+        get_request_cache(request)['execute_url'] = self._get_execute_url()
+
         # handle requested action if required
         response = self._handle_action(request)
         if response:
             return response
 
         # continue normally
-        return super().changelist_view(request, extra_context)
+        response = super().changelist_view(request, extra_context)
+        self._track_render_timings(request, response)
+        return response
+
+    def _track_render_timings(self, request, response):
+        """
+        Measures `render_inline_actions` of all admins while `response` is
+        rendered and sends `inline_actions_rendered` afterwards.
+        """
+        if not (
+            isinstance(response, SimpleTemplateResponse)
+            and has_receivers(inline_actions_rendered)
+        ):
+            return
+
+        timings = get_request_cache(request)['render_timings'] = {}
+
+        def send_timings(response):
+            for model_admin, (rows, duration) in timings.items():
+                inline_actions_rendered.send(
+                    type(model_admin),
+                    model_admin=model_admin,
+                    request=request,
+                    rows=rows,
+                    duration=duration,
+                )
+
+        response.add_post_render_callback(send_timings)
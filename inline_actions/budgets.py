@@ -0,0 +1,85 @@
+import sys
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.db import connections
+
+_enforced = False
+
+
+def query_budgets_enforced():
+    """
+    Returns whether the `max_queries` budgets are checked.
+
+    They are checked if `DEBUG` is enabled or within `enforce_query_budgets`.
+    """
+    return _enforced or settings.DEBUG
+
+
+@contextmanager
+def enforce_query_budgets(enforce=True):
+    """
+    Checks the `max_queries` budgets regardless of `DEBUG`, e.g. in tests.
+    """
+    global _enforced
+    previous, _enforced = _enforced, enforce
+    try:
+        yield
+    finally:
+        _enforced = previous
+
+
+class QueryCounter:
+    """
+    Counts the queries executed on all databases while it is active.
+
+    Queries are attributed to the innermost public method of `model_admin`,
+    which caused them, e.g. a label handler or a permission check. Without
+    `model_admin`, queries are only counted.
+    """
+
+    def __init__(self, model_admin=None):
+        self.model_admin = model_admin
+        self.counts = {}
+        self._stack = None
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+    def __enter__(self):
+        self._stack = ExitStack()
+        for connection in connections.all():
+            self._stack.enter_context(connection.execute_wrapper(self))
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stack.close()
+        self._stack = None
+
+    def __call__(self, execute, sql, params, many, context):
+        source = self._get_source(sys._getframe(1))
+        self.counts[source] = self.counts.get(source, 0) + 1
+        return execute(sql, params, many, context)
+
+    def _get_source(self, frame):
+        if self.model_admin is None:
+            return None
+        while frame is not None:
+            name = frame.f_code.co_name
+            if (
+                not name.startswith('_')
+                and frame.f_locals.get('self') is self.model_admin
+            ):
+                return name
+            frame = frame.f_back
+        return '<unknown>'
+
+    def report(self):
+        """
+        Returns the number of queries per source, the most expensive first.
+        """
+        counts = sorted(self.counts.items(), key=lambda item: -item[1])
+        return '\n'.join(
+            '  - {}: {} queries'.format(source, count) for source, count in counts
+        )
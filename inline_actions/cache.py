@@ -0,0 +1,79 @@
+import hashlib
+import uuid
+
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db.models.signals import post_delete, post_save
+
+KEY_PREFIX = 'inline_actions'
+DEFAULT_TIMEOUT = 300  # seconds
+
+# used, if no cache alias is configured; evicts the least recently used entries
+# and is not shared between processes, so invalidations only reach the process,
+# which saved or deleted the object
+_local_cache = LocMemCache(
+    'inline_actions',
+    {'TIMEOUT': DEFAULT_TIMEOUT, 'OPTIONS': {'MAX_ENTRIES': 10000}},
+)
+
+# concrete models, whose fragments are cached, and the used cache aliases
+_watched_models = {}
+
+
+def get_fragment_cache(alias=None):
+    """
+    Returns the cache backend configured by `alias` or a local memory cache.
+    """
+    if alias is None:
+        return _local_cache
+    return caches[alias]
+
+
+def _hash(*parts):
+    return hashlib.md5(repr(parts).encode()).hexdigest()
+
+
+def _version_key(model, pk):
+    return '{}:version:{}'.format(
+        KEY_PREFIX, _hash(model._meta.concrete_model._meta.label_lower, str(pk))
+    )
+
+
+def make_fragment_key(*parts):
+    """
+    Returns a cache key for the html fragment identified by `parts`.
+    """
+    return '{}:fragment:{}'.format(KEY_PREFIX, _hash(*parts))
+
+
+def get_versions(cache, model, pks):
+    """
+    Returns a mapping of `pk` to the current cache version of the object.
+
+    Unknown versions, e.g. after an invalidation or eviction, are initialized
+    with a new random value, so that previously cached fragments are never
+    reused.
+    """
+    keys = {_version_key(model, pk): pk for pk in pks}
+    versions = cache.get_many(keys)
+    missing = {key: uuid.uuid4().hex for key in keys if key not in versions}
+    if missing:
+        cache.set_many(missing, timeout=None)
+        versions.update(missing)
+    return {pk: versions[key] for key, pk in keys.items()}
+
+
+def watch_model(model, alias=None):
+    """
+    Invalidates the cached fragments of an object of `model` in the cache
+    `alias`, whenever it is saved or deleted.
+    """
+    if not _watched_models:
+        post_save.connect(_invalidate_object, dispatch_uid='inline_actions.cache')
+        post_delete.connect(_invalidate_object, dispatch_uid='inline_actions.cache')
+    _watched_models.setdefault(model._meta.concrete_model, set()).add(alias)
+
+
+def _invalidate_object(sender, instance, **kwargs):
+    for alias in _watched_models.get(sender._meta.concrete_model, ()):
+        get_fragment_cache(alias).delete(_version_key(sender, instance.pk))
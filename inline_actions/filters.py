@@ -0,0 +1,33 @@
+from django.contrib import admin
+from django.utils.translation import gettext_lazy as _
+
+
+class InlineActionListFilter(admin.SimpleListFilter):
+    """
+    Filters the changelist by the actions available for an object.
+
+    Only actions with a `visible_if` condition are listed, the filter applies
+    their condition to the queryset of the changelist.
+    """
+
+    title = _("available action")
+    parameter_name = 'inline_action'
+
+    def __init__(self, request, params, model, model_admin):
+        self.visibility = model_admin._get_queryset_hints()[2]
+        super().__init__(request, params, model, model_admin)
+
+    def lookups(self, request, model_admin):
+        return [
+            (name, model_admin._get_action_descriptor(name).label)
+            for name in self.visibility
+        ]
+
+    def queryset(self, request, queryset):
+        condition = self.visibility.get(self.value())
+        if condition is None:
+            return None
+        # filtering by a subquery, conditions on to-many relations would
+        # duplicate the rows otherwise
+        visible = queryset.model._default_manager.filter(condition)
+        return queryset.filter(pk__in=visible.values('pk'))
@@ -0,0 +1,250 @@
+import threading
+
+from django.http import HttpResponse
+
+from .signals import (
+    inline_action_failed,
+    inline_action_finished,
+    inline_actions_rendered,
+)
+
+# upper bounds of the latency histogram in seconds, same as the defaults
+# of the prometheus client libraries
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def get_admin_label(model_admin_class):
+    """
+    Returns the name used to identify `model_admin_class` in metrics.
+    """
+    return '{}.{}'.format(model_admin_class.__module__, model_admin_class.__qualname__)
+
+
+class ActionStats:
+    __slots__ = ('calls', 'errors', 'duration', 'buckets')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.duration = 0.0
+        # one counter per bucket and one for all slower calls
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+    def observe(self, duration, error):
+        self.calls += 1
+        self.errors += error
+        self.duration += duration
+        for index, bound in enumerate(BUCKETS):
+            if duration <= bound:
+                break
+        else:
+            index = len(BUCKETS)
+        self.buckets[index] += 1
+
+    @property
+    def mean(self):
+        return self.duration / self.calls if self.calls else 0.0
+
+    def quantile(self, q):
+        """
+        Returns the upper bound of the bucket containing the quantile `q`,
+        `None` if it is slower than the largest bucket.
+        """
+        rank = q * self.calls
+        cumulative = 0
+        for bound, count in zip(BUCKETS, self.buckets):
+            cumulative += count
+            if cumulative >= rank:
+                return bound
+        return None
+
+
+class RenderStats:
+    __slots__ = ('pages', 'rows', 'duration')
+
+    def __init__(self):
+        self.pages = 0
+        self.rows = 0
+        self.duration = 0.0
+
+    @property
+    def per_row(self):
+        return self.duration / self.rows if self.rows else 0.0
+
+
+class MetricsRegistry:
+    """
+    Aggregates the instrumentation signals per admin and action in memory.
+
+    Updates only hold the lock for incrementing a few counters.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._actions = {}
+        self._renders = {}
+
+    def observe_action(self, admin_label, action, duration, error=False):
+        key = (admin_label, action)
+        with self._lock:
+            stats = self._actions.get(key)
+            if stats is None:
+                stats = self._actions[key] = ActionStats()
+            stats.observe(duration, error)
+
+    def observe_render(self, admin_label, rows, duration):
+        with self._lock:
+            stats = self._renders.get(admin_label)
+            if stats is None:
+                stats = self._renders[admin_label] = RenderStats()
+            stats.pages += 1
+            stats.rows += rows
+            stats.duration += duration
+
+    def get_action_stats(self, admin_label, action):
+        return self._actions.get((admin_label, action))
+
+    def get_action_names(self, admin_label):
+        """
+        Returns the names of all actions of `admin_label` with recorded calls.
+        """
+        return sorted(
+            action for label, action in list(self._actions) if label == admin_label
+        )
+
+    def get_render_stats(self, admin_label):
+        return self._renders.get(admin_label)
+
+    def reset(self):
+        with self._lock:
+            self._actions.clear()
+            self._renders.clear()
+
+    def to_prometheus(self):
+        """
+        Returns all metrics in the prometheus text exposition format.
+        """
+        with self._lock:
+            actions = sorted(self._actions.items())
+            renders = sorted(self._renders.items())
+
+        lines = []
+
+        def add_metric(name, metric_type, help_text, samples):
+            lines.append('# HELP {} {}'.format(name, help_text))
+            lines.append('# TYPE {} {}'.format(name, metric_type))
+            for suffix, labels, value in samples:
+                lines.append(
+                    '{}{}{{{}}} {}'.format(name, suffix, _format_labels(labels), value)
+                )
+
+        add_metric(
+            'inline_actions_action_calls_total',
+            'counter',
+            'Number of executed inline actions.',
+            [('', _action_labels(key), stats.calls) for key, stats in actions],
+        )
+        add_metric(
+            'inline_actions_action_errors_total',
+            'counter',
+            'Number of inline actions, which raised an exception.',
+            [('', _action_labels(key), stats.errors) for key, stats in actions],
+        )
+        add_metric(
+            'inline_actions_action_duration_seconds',
+            'histogram',
+            'Duration of inline actions.',
+            [
+                sample
+                for key, stats in actions
+                for sample in _histogram_samples(_action_labels(key), stats)
+            ],
+        )
+        add_metric(
+            'inline_actions_render_rows_total',
+            'counter',
+            'Number of rendered rows.',
+            [('', [('admin', admin)], stats.rows) for admin, stats in renders],
+        )
+        add_metric(
+            'inline_actions_render_duration_seconds_total',
+            'counter',
+            'Time spent rendering the actions of all rows.',
+            [('', [('admin', admin)], stats.duration) for admin, stats in renders],
+        )
+        return '\n'.join(lines) + '\n'
+
+    def receive_action(self, sender, action, duration, **kwargs):
+        error = 'exception' in kwargs
+        self.observe_action(get_admin_label(sender), action, duration, error)
+
+    def receive_render(self, sender, rows, duration, **kwargs):
+        self.observe_render(get_admin_label(sender), rows, duration)
+
+    def connect(self, sender):
+        """
+        Collects the metrics of the admin class `sender`.
+
+        Connecting any receiver enables the instrumentation of all admins, so
+        it is only done for admins with `inline_actions_metrics = True`.
+        """
+        uid = (id(self), sender)
+        inline_action_finished.connect(
+            self.receive_action, sender=sender, dispatch_uid=uid
+        )
+        inline_action_failed.connect(
+            self.receive_action, sender=sender, dispatch_uid=uid
+        )
+        inline_actions_rendered.connect(
+            self.receive_render, sender=sender, dispatch_uid=uid
+        )
+
+    def disconnect(self, sender):
+        uid = (id(self), sender)
+        for signal in (
+            inline_action_finished,
+            inline_action_failed,
+            inline_actions_rendered,
+        ):
+            signal.disconnect(sender=sender, dispatch_uid=uid)
+
+
+def _action_labels(key):
+    admin, action = key
+    return [('admin', admin), ('action', action)]
+
+
+def _format_labels(labels):
+    return ','.join(
+        '{}="{}"'.format(
+            name,
+            str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'),
+        )
+        for name, value in labels
+    )
+
+
+def _histogram_samples(labels, stats):
+    cumulative = 0
+    for bound, count in zip(BUCKETS + ('+Inf',), stats.buckets):
+        cumulative += count
+        yield '_bucket', labels + [('le', bound)], cumulative
+    yield '_sum', labels, stats.duration
+    yield '_count', labels, stats.calls
+
+
+registry = MetricsRegistry()
+
+
+def prometheus_view(request):
+    """
+    Returns the collected metrics in the prometheus text format.
+
+    The view does not check any permissions, so the project has to mount it
+    behind the authentication of its scraper, e.g. a decorator checking a
+    bearer token or a path only reachable from the internal network.
+    """
+    return HttpResponse(
+        registry.to_prometheus(),
+        content_type='text/plain; version=0.0.4; charset=utf-8',
+    )
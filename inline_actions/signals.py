@@ -0,0 +1,28 @@
+from django.dispatch import Signal
+
+# All signals are sent with the admin class as sender.
+
+# Sent before an action is executed.
+# kwargs: model_admin, request, action, obj, pk
+inline_action_started = Signal()
+
+# Sent after an action has been executed.
+# kwargs: model_admin, request, action, obj, pk, duration, queries, response_type
+inline_action_finished = Signal()
+
+# Sent if an action raised an exception.
+# kwargs: model_admin, request, action, obj, pk, duration, queries, exception
+inline_action_failed = Signal()
+
+# Sent once per request and admin after the page has been rendered.
+# kwargs: model_admin, request, rows, duration
+inline_actions_rendered = Signal()
+
+ACTION_SIGNALS = (inline_action_started, inline_action_finished, inline_action_failed)
+
+
+def has_receivers(*signals):
+    """
+    Returns whether any receiver is connected to one of `signals`.
+    """
+    return any(signal.receivers for signal in signals)
@@ -0,0 +1,123 @@
+/*
+ * Executes inline actions with `ajax = True` (buttons marked with
+ * `data-ajax`) using the json endpoint of the admin instead of submitting the
+ * whole changelist or change form.
+ *
+ * Browsers without `fetch` submit the form as usual. Failed requests are
+ * reported without submitting the action again, as it might have been
+ * executed already, e.g. if only the response got lost.
+ */
+(function () {
+  'use strict';
+
+  var TOKEN_FIELD = '_inline_action';
+
+  if (!window.fetch || !window.FormData) {
+    return;
+  }
+
+  function showMessages(messages) {
+    if (!messages.length) {
+      return;
+    }
+    var list = document.querySelector('ul.messagelist');
+    if (!list) {
+      var content = document.getElementById('content');
+      list = document.createElement('ul');
+      list.className = 'messagelist';
+      content.parentNode.insertBefore(list, content);
+    }
+    messages.forEach(function (message) {
+      var item = document.createElement('li');
+      item.className = message.tags;
+      item.textContent = message.message;
+      list.appendChild(item);
+    });
+  }
+
+  function showError(text) {
+    showMessages([{tags: 'error', message: 'The action failed: ' + text}]);
+  }
+
+  function replaceActions(bar, html) {
+    var container = document.createElement('div');
+    container.innerHTML = html;
+    bar.parentNode.replaceChild(container.firstElementChild, bar);
+  }
+
+  function handleResult(bar, result) {
+    if (result.redirect) {
+      window.location.href = result.redirect;
+    } else if (result.actions === null) {
+      // e.g. deleted or multiple selected objects, the messages are kept
+      // for the reloaded page
+      window.location.reload();
+    } else {
+      showMessages(result.messages);
+      replaceActions(bar, result.actions);
+    }
+  }
+
+  function handleResponse(bar, button, response) {
+    var contentType = response.headers.get('Content-Type') || '';
+    if (!response.ok) {
+      button.disabled = false;
+      showError(response.status + ' ' + response.statusText);
+    } else if (contentType.indexOf('application/json') !== 0) {
+      // e.g. a page rendered by an action, which should not use `ajax`
+      button.disabled = false;
+      showError('unexpected response, please reload the page.');
+    } else {
+      return response.json().then(function (result) {
+        handleResult(bar, result);
+      });
+    }
+  }
+
+  function execute(bar, button) {
+    var form = button.form;
+    var data = new FormData();
+    data.append(TOKEN_FIELD, button.value);
+    data.append('_inline_actions_render', '1');
+
+    var csrfToken = form.querySelector('input[name="csrfmiddlewaretoken"]');
+    if (csrfToken) {
+      data.append(csrfToken.name, csrfToken.value);
+    }
+    var selected = form.querySelectorAll('input[name="_selected_action"]:checked');
+    Array.prototype.forEach.call(selected, function (checkbox) {
+      data.append(checkbox.name, checkbox.value);
+    });
+
+    button.disabled = true;
+    fetch(bar.getAttribute('data-execute-url'), {
+      method: 'POST',
+      body: data,
+      credentials: 'same-origin',
+      headers: {'Accept': 'application/json'}
+    }).then(function (response) {
+      return handleResponse(bar, button, response);
+    }, function () {
+      // e.g. a network error, the action might have been executed anyway,
+      // so the button stays disabled until the page is reloaded
+      showError('the server could not be reached, please reload the page.');
+    }).catch(function (error) {
+      // the action has been executed, but the result is unreadable
+      button.disabled = false;
+      showError(error.message);
+    });
+  }
+
+  document.addEventListener('click', function (event) {
+    var button = event.target.closest('button[name="' + TOKEN_FIELD + '"][data-ajax]');
+    if (!button || !button.form) {
+      return;
+    }
+    var bar = button.closest('.inline_actions[data-execute-url]');
+    if (!bar) {
+      return;
+    }
+    event.preventDefault();
+    execute(bar, button);
+  });
+})();
@@ -1,5 +1,7 @@
 from django import template
-from django.utils.safestring import mark_safe
+from django.utils.html import format_html
+
+from ..tokens import TOKEN_FIELD, get_action_tokens
 
 register = template.Library()
 
@@ -9,17 +11,14 @@ def render_inline_action_fields(context):
     """
     Render hidden fields, which are required for identifying an action.
     """
-    request = context.get('request', {'POST': {}})
-    all_actions = [
-        key for key in list(request.POST.keys()) if key.startswith('_action__')
-    ]
-    if len(all_actions) == 0:
+    tokens = get_action_tokens(context.get('request'))
+    if len(tokens) == 0:
         raise RuntimeError("No inline action has been triggered.")
-    if len(all_actions) > 1:
+    if len(tokens) > 1:
         raise RuntimeError(
             "Multiple inline actions have been triggered simultaneously."
         )
 
-    action_key = all_actions[0]
-    fields = '<input type="hidden" name="{}" value="">'.format(action_key)
-    return mark_safe(fields)
+    return format_html(
+        '<input type="hidden" name="{}" value="{}">', TOKEN_FIELD, tokens[0]
+    )
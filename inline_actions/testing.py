@@ -0,0 +1,91 @@
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+from . import signals
+from .budgets import enforce_query_budgets
+
+__all__ = ['SignalCollector', 'assert_constant_queries', 'enforce_query_budgets']
+
+SIGNAL_NAMES = (
+    'inline_action_started',
+    'inline_action_finished',
+    'inline_action_failed',
+    'inline_actions_rendered',
+)
+
+
+def assert_constant_queries(run, setup, sizes=(1, 10), using=DEFAULT_DB_ALIAS):
+    """
+    Asserts that `run()` executes the same number of queries regardless of
+    the number of rows.
+
+    `setup(size)` is called before each run and has to provide `size` rows,
+    e.g. by creating the missing objects. Use it to detect N+1 queries caused
+    by actions, label or css handlers and permission checks.
+
+    `run()` is called once upfront, so that queries of a first request (e.g.
+    filling caches) are not counted.
+    """
+    setup(min(sizes))
+    run()
+
+    captured = {}
+    for size in sizes:
+        setup(size)
+        with CaptureQueriesContext(connections[using]) as context:
+            run()
+        captured[size] = context.captured_queries
+
+    counts = {size: len(queries) for size, queries in captured.items()}
+    if len(set(counts.values())) > 1:
+        largest = max(sizes)
+        raise AssertionError(
+            "The number of queries grows with the number of rows ({}).\n"
+            "Queries for {} rows:\n{}".format(
+                ', '.join(
+                    '{} rows: {} queries'.format(size, count)
+                    for size, count in counts.items()
+                ),
+                largest,
+                '\n'.join(query['sql'] for query in captured[largest]),
+            )
+        )
+
+
+class SignalCollector:
+    """
+    Collects the instrumentation signals of `inline_actions.signals` in memory.
+
+    Every event is a dictionary containing the name of the `signal`, the
+    `sender` and all arguments sent with it.
+
+        with SignalCollector() as collector:
+            client.get(url)
+        collector.events_for('inline_actions_rendered')
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def __enter__(self):
+        for name in SIGNAL_NAMES:
+            getattr(signals, name).connect(
+                self._make_receiver(name), weak=False, dispatch_uid=(id(self), name)
+            )
+        return self
+
+    def __exit__(self, *exc_info):
+        for name in SIGNAL_NAMES:
+            getattr(signals, name).disconnect(dispatch_uid=(id(self), name))
+
+    def _make_receiver(self, name):
+        def receiver(sender, signal, **kwargs):
+            self.events.append(dict(kwargs, signal=name, sender=sender))
+
+        return receiver
+
+    def events_for(self, name):
+        """
+        Returns the events sent by the signal `name`.
+        """
+        return [event for event in self.events if event['signal'] == name]
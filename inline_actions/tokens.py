@@ -0,0 +1,87 @@
+import hashlib
+import hmac
+
+from django.conf import settings
+from django.core.signing import BadSignature, b64_encode
+from django.utils.crypto import constant_time_compare
+from django.utils.encoding import force_bytes
+
+# name of the submit button / hidden field carrying the token
+TOKEN_FIELD = '_inline_action'
+
+KEY_SALT = 'inline_actions.tokens'
+SIGNATURE_LENGTH = 9  # bytes, results in 12 characters
+
+_hmac_cache = {}
+
+
+def _get_hmac(scope):
+    """
+    Returns the initialized HMAC for the current `SECRET_KEY` and `scope`.
+
+    The key derivation is the same as in `django.utils.crypto.salted_hmac`,
+    but only done once per `SECRET_KEY`. The `scope` is fed into the HMAC
+    once per scope.
+    """
+    secret = settings.SECRET_KEY
+    scopes = _hmac_cache.get(secret)
+    if scopes is None:
+        _hmac_cache.clear()
+        scopes = _hmac_cache[secret] = {}
+    try:
+        return scopes[scope]
+    except KeyError:
+        key = hashlib.sha1(force_bytes(KEY_SALT + secret)).digest()
+        base_hmac = hmac.new(key, digestmod=hashlib.sha1)
+        # the scope never contains a null byte, so it is delimited unambiguously
+        base_hmac.update('{}\0'.format(scope).encode())
+        scopes[scope] = base_hmac
+        return base_hmac
+
+
+def _sign(payload, scope):
+    signature = _get_hmac(scope).copy()
+    signature.update(payload.encode())
+    return b64_encode(signature.digest()[:SIGNATURE_LENGTH]).decode()
+
+
+def make_token(prefix, pk, scope=''):
+    """
+    Returns a signed token for `prefix` (`<admin key>:<action>:`) and `pk`.
+
+    The signature also covers `scope`, which identifies the admin handling
+    the token (see `BaseInlineActionsMixin._get_token_scope`), but is not part
+    of the token. Tokens are therefore only accepted by the same admin.
+    """
+    payload = '{}{}'.format(prefix, pk)
+    return '{}:{}'.format(payload, _sign(payload, scope))
+
+
+def get_action_tokens(request):
+    """
+    Returns the tokens of the actions triggered by `request`.
+
+    Only the reserved `TOKEN_FIELD` is looked up, so detecting an action does
+    not depend on the number of other fields posted, e.g. by large formsets.
+    """
+    if request is None or request.method != 'POST':
+        return []
+    return request.POST.getlist(TOKEN_FIELD)
+
+
+def parse_token(token, scope=''):
+    """
+    Returns a tuple of `(admin key, action, pk)` encoded in `token`.
+
+    raises
+        BadSignature - When the token is malformed, has been tampered with or
+            has been issued for a different `scope`
+    """
+    payload, sep, signature = token.rpartition(':')
+    if not sep or not constant_time_compare(signature, _sign(payload, scope)):
+        raise BadSignature("Inline action token `{}` is invalid.".format(token))
+
+    parts = payload.split(':', 2)
+    if len(parts) != 3:
+        raise BadSignature("Inline action token `{}` is malformed.".format(token))
+    return tuple(parts)
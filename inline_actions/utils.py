@@ -0,0 +1,222 @@
+import re
+import threading
+import uuid
+from urllib.parse import quote
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.template.loader import select_template
+from django.urls import NoReverseMatch, get_script_prefix, get_urlconf, reverse
+from django.utils.http import RFC3986_SUBDELIMS
+from django.utils.translation import get_language
+
+try:
+    from asgiref.sync import async_to_sync
+except ImportError:  # pragma: no cover, django < 3.0
+    async_to_sync = None
+
+try:
+    from django.utils.autoreload import file_changed
+except ImportError:  # pragma: no cover, django < 2.2
+    file_changed = None
+
+try:
+    from contextvars import ContextVar
+except ImportError:  # pragma: no cover, python 3.6
+
+    class ContextVar(threading.local):  # type: ignore
+        """
+        Minimal, thread-local replacement for `contextvars.ContextVar`.
+        """
+
+        def __init__(self, name, default=None):
+            self.name = name
+            self.value = default
+
+        def get(self):
+            return self.value
+
+        def set(self, value):
+            self.value = value
+
+
+_current_request = ContextVar('inline_actions_request', default=None)
+
+
+def get_current_request():
+    """
+    Returns the request, which is currently processed by an inline actions admin.
+    """
+    return _current_request.get()
+
+
+def set_current_request(request):
+    """
+    Binds `request` to the current context (thread or asyncio task).
+
+    `render_inline_actions` is called by Django without access to the request.
+    The request is therefore bound to the current context and not stored on
+    the admin instance, which is shared between all threads.
+    """
+    _current_request.set(request)
+
+
+def get_request_cache(request):
+    """
+    Returns a dictionary, which lives as long as the given `request`.
+
+    Objects which do not accept attributes (e.g. a plain dict used as fake
+    request in tests) receive a new, empty dictionary on every call.
+    """
+    try:
+        return request.__dict__.setdefault('_inline_actions_cache', {})
+    except AttributeError:
+        return {}
+
+
+def clear_request_cache(request, keep=()):
+    """
+    Removes all entries from the cache of `request` except for `keep`.
+    """
+    cache = get_request_cache(request)
+    kept = {key: cache[key] for key in keep if key in cache}
+    cache.clear()
+    cache.update(kept)
+
+
+# placeholder substituted by the pk of the object
+_PK_PLACEHOLDER = 'inline-actions-pk'
+_admin_url_cache = {}
+
+
+@receiver(setting_changed)
+def clear_admin_url_cache(**kwargs):
+    """
+    Clears the cached admin urls, e.g. if `ROOT_URLCONF` is overridden in tests.
+    """
+    _admin_url_cache.clear()
+
+
+def get_admin_url(admin_site_name, opts, view, pk=None):
+    """
+    Returns the url of the admin `view` (e.g. `changelist` or `change`) of the
+    model described by `opts`, like `reverse` does.
+
+    The url is resolved once per admin site, URLconf, script prefix and
+    language (e.g. for `i18n_patterns`). Only the `pk` is substituted on
+    subsequent calls.
+    """
+    viewname = '{}:{}_{}_{}'.format(
+        admin_site_name, opts.app_label, opts.model_name, view
+    )
+    key = (get_urlconf(), get_script_prefix(), get_language(), viewname, pk is None)
+    try:
+        prefix, suffix = _admin_url_cache[key]
+    except KeyError:
+        args = () if pk is None else (_PK_PLACEHOLDER,)
+        try:
+            url = reverse(viewname, args=args)
+        except NoReverseMatch:
+            # the url does not accept arbitrary pks, e.g. a custom converter
+            return reverse(viewname, args=(pk,))
+        prefix, _, suffix = url.partition(_PK_PLACEHOLDER)
+        _admin_url_cache[key] = (prefix, suffix)
+
+    if pk is None:
+        return prefix
+    return '{}{}{}'.format(
+        prefix, quote(str(pk), safe=RFC3986_SUBDELIMS + '/~:@'), suffix
+    )
+
+
+_template_cache = {}
+
+
+@receiver(setting_changed)
+def clear_template_cache(**kwargs):
+    """
+    Clears the cached templates, e.g. if `TEMPLATES` is overridden in tests.
+    """
+    _template_cache.clear()
+
+
+if file_changed is not None:
+    # the development server reloads templates without restarting
+    file_changed.connect(clear_template_cache)
+
+
+def get_cached_template(template_names):
+    """
+    Returns the first existing template of `template_names`.
+
+    The template is looked up and compiled once and reused afterwards.
+    """
+    key = tuple(template_names)
+    try:
+        return _template_cache[key]
+    except KeyError:
+        template = _template_cache[key] = select_template(key)
+        return template
+
+
+# unique per process, so that it does not collide with any rendered content
+_PLACEHOLDER = 'inline-actions-{}-'.format(uuid.uuid4().hex)
+_placeholder_re = re.compile(r'{}(\d+)'.format(re.escape(_PLACEHOLDER)))
+
+
+def make_placeholder(index):
+    """
+    Returns a placeholder, which is replaced by `fill_placeholders`.
+    """
+    return '{}{}'.format(_PLACEHOLDER, index)
+
+
+def split_placeholders(text):
+    """
+    Splits `text` at the placeholders created by `make_placeholder`.
+
+    Returns a list alternating between text and placeholder indices, starting
+    and ending with text.
+    """
+    parts = _placeholder_re.split(text)
+    parts[1::2] = [int(index) for index in parts[1::2]]
+    return parts
+
+
+def fill_placeholders(parts, values):
+    """
+    Joins `parts` as returned by `split_placeholders`, replacing every
+    placeholder by the value with its index.
+    """
+    result = list(parts)
+    result[1::2] = [values[index] for index in parts[1::2]]
+    return ''.join(result)
+
+
+async def _await(awaitable):
+    return await awaitable
+
+
+def get_content_disposition(filename):
+    """
+    Returns the `Content-Disposition` header for downloading `filename`.
+    """
+    try:
+        filename.encode('ascii')
+    except UnicodeEncodeError:
+        return "attachment; filename*=utf-8''{}".format(quote(filename))
+    return 'attachment; filename="{}"'.format(filename.replace('"', '\\"'))
+
+
+def resolve_awaitable(awaitable):
+    """
+    Awaits `awaitable` from synchronous code and returns its result.
+
+    Under ASGI, the admin views run in a worker thread and the awaitable is
+    scheduled on the event loop of the server. Under WSGI, a new event loop
+    is used for the current thread.
+    """
+    if async_to_sync is None:  # pragma: no cover, django < 3.0
+        raise ImproperlyConfigured("Async inline actions require `asgiref`.")
+    return async_to_sync(_await)(awaitable)
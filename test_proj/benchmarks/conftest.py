@@ -0,0 +1,82 @@
+import pytest
+from django.contrib import admin
+
+from inline_actions.admin import InlineActionsMixin, InlineActionsModelAdminMixin
+from inline_actions.utils import set_current_request
+from test_proj.blog.models import Article, Author
+
+
+def noop_action(self, request, obj, parent_obj=None):
+    pass
+
+
+def make_admin_class(base, actions, dynamic=False, **attrs):
+    """
+    Returns an admin class derived from `base` with `actions` noop actions.
+
+    Dynamic actions define per-object label and css handlers, which result in
+    two distinct action bars.
+    """
+    attrs['inline_actions'] = []
+    for index in range(actions):
+        name = 'action_{}'.format(index)
+        attrs['inline_actions'].append(name)
+        attrs[name] = noop_action
+        if dynamic:
+            attrs['get_{}_label'.format(name)] = lambda self, obj: 'Label {}'.format(
+                obj.pk % 2
+            )
+            attrs['get_{}_css'.format(name)] = lambda self, obj: 'css-{}'.format(
+                obj.pk % 2
+            )
+
+    name = 'Benchmark{}{}Admin'.format(actions, 'Dynamic' if dynamic else 'Static')
+    return type(name, (base,), attrs)
+
+
+def make_model_admin_class(actions, dynamic=False, **attrs):
+    base = type(
+        'BenchmarkModelAdmin', (InlineActionsModelAdminMixin, admin.ModelAdmin), {}
+    )
+    return make_admin_class(base, actions, dynamic, **attrs)
+
+
+def make_inline_class(name):
+    return type(
+        name,
+        (InlineActionsMixin, admin.TabularInline),
+        {
+            'model': Article,
+            'inline_actions': ['noop_action'],
+            'noop_action': noop_action,
+        },
+    )
+
+
+@pytest.fixture
+def admin_request(rf, admin_user):
+    def admin_request(method='get', data=None):
+        request = getattr(rf, method)('/', data=data or {})
+        request.user = admin_user
+        request._dont_enforce_csrf_checks = True
+        set_current_request(request)
+        return request
+
+    yield admin_request
+    set_current_request(None)
+
+
+@pytest.fixture
+def author(db):
+    return Author.objects.create(name='Author')
+
+
+@pytest.fixture
+def articles(author):
+    def articles(count):
+        Article.objects.bulk_create(
+            Article(author=author, title=str(index), body='') for index in range(count)
+        )
+        return list(Article.objects.filter(author=author))
+
+    return articles
@@ -0,0 +1,28 @@
+import pytest
+from django.contrib import admin
+
+from inline_actions.tokens import TOKEN_FIELD, make_token
+from test_proj.blog.models import Author
+
+from .conftest import make_inline_class, make_model_admin_class
+
+
+@pytest.mark.parametrize('inlines', [1, 30])
+def test_handle_action(benchmark, admin_request, articles, inlines):
+    """Dispatches an action of the last of `inlines` inlines."""
+    inline_classes = [
+        make_inline_class('BenchmarkInline{}'.format(index)) for index in range(inlines)
+    ]
+    model_admin_class = make_model_admin_class(0, inlines=inline_classes)
+    model_admin = model_admin_class(Author, admin.site)
+
+    article = articles(1)[0]
+    prefix = 'benchmarkinline{}:noop_action:'.format(inlines - 1)
+    data = {TOKEN_FIELD: make_token(prefix, article.pk, 'admin:blog.author')}
+
+    def handle_action():
+        request = admin_request('post', data)
+        response = model_admin._handle_action(request, str(article.author.pk))
+        assert response.status_code == 302
+
+    benchmark(handle_action)
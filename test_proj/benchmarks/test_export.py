@@ -0,0 +1,76 @@
+import os
+
+import pytest
+from django.contrib import admin
+
+from inline_actions.actions import ExportAction
+from inline_actions.admin import InlineActionsMixin
+from test_proj.blog.models import Article, Author
+
+# override with `BENCHMARK_EXPORT_ROWS=10000` for a quick run
+ROWS = int(os.environ.get('BENCHMARK_EXPORT_ROWS', 1000000))
+BATCH_SIZE = 10000
+
+# maximum growth of the resident set size while streaming all rows
+MAX_MEMORY = 20 * 1024 * 1024  # bytes
+# number of chunks between two measurements of the resident set size
+SAMPLE_INTERVAL = 1000
+
+
+class ExportArticleInline(ExportAction, InlineActionsMixin, admin.TabularInline):
+    model = Article
+    export_fields = ['id', 'title', 'status']
+
+
+@pytest.fixture
+def exported_author(author):
+    for offset in range(0, ROWS, BATCH_SIZE):
+        Article.objects.bulk_create(
+            Article(author=author, title='Title {}'.format(index), body='')
+            for index in range(offset, min(offset + BATCH_SIZE, ROWS))
+        )
+    return author
+
+
+def get_rss():
+    """
+    Returns the current resident set size of the process in bytes.
+
+    `resource.getrusage` only reports the peak since the start of the process,
+    which is already raised by creating the rows, so the current size is read
+    from `/proc` instead.
+    """
+    with open('/proc/self/statm') as statm:
+        return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def consume(response, on_sample=None):
+    size = 0
+    for index, chunk in enumerate(response.streaming_content):
+        size += len(chunk)
+        if on_sample is not None and index % SAMPLE_INTERVAL == 0:
+            on_sample()
+    return size
+
+
+@pytest.mark.parametrize('export_format', ['csv', 'jsonl'])
+def test_export(benchmark, admin_request, exported_author, export_format):
+    inline = ExportArticleInline(Author, admin.site)
+    inline.export_format = export_format
+    request = admin_request('post')
+
+    def export(on_sample=None):
+        queryset = Article.objects.none()
+        response = inline.export_action(request, queryset, exported_author)
+        return consume(response, on_sample)
+
+    # the rows are streamed, so the memory does not grow with their number;
+    # measured before the benchmark, which could leave freed memory resident
+    if os.path.exists('/proc/self/statm'):
+        start = get_rss()
+        samples = [start]
+        export(lambda: samples.append(get_rss()))
+        samples.append(get_rss())
+        assert max(samples) - start < MAX_MEMORY
+
+    assert benchmark.pedantic(export, rounds=1) > 0
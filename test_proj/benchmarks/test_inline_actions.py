@@ -0,0 +1,20 @@
+from django.contrib import admin
+
+from test_proj.blog.admin import ArticleAdmin
+from test_proj.blog.models import Article
+
+
+def test_get_inline_actions(benchmark, admin_request):
+    """`get_inline_actions` of an admin with a deep stack of mixins."""
+    model_admin = ArticleAdmin(Article, admin.site)
+    request = admin_request()
+    objs = [
+        Article(pk=pk, status=Article.DRAFT if pk % 2 else Article.PUBLISHED)
+        for pk in range(1, 1001)
+    ]
+
+    def get_inline_actions():
+        for obj in objs:
+            model_admin.get_inline_actions(request, obj)
+
+    benchmark(get_inline_actions)
@@ -0,0 +1,114 @@
+import timeit
+
+import pytest
+from django.contrib import admin
+from django.utils.safestring import mark_safe
+
+from inline_actions.tokens import TOKEN_FIELD, make_token
+from test_proj.blog.models import Article
+
+from .conftest import make_model_admin_class
+
+# tolerance for timer noise when comparing the template with string building
+MAX_SLOWDOWN = 1.2
+
+
+@pytest.mark.parametrize('rows', [100, 1000])
+@pytest.mark.parametrize('actions', [1, 5])
+@pytest.mark.parametrize('dynamic', [False, True], ids=['static', 'dynamic'])
+def test_render_inline_actions(benchmark, admin_request, rows, actions, dynamic):
+    """Renders a page of `rows` rows with `actions` actions each."""
+    model_admin = make_model_admin_class(actions, dynamic)(Article, admin.site)
+    objs = [Article(pk=pk, title='Title') for pk in range(1, rows + 1)]
+
+    def render_page():
+        request = admin_request()
+        model_admin._set_inline_actions_objects(request, objs)
+        for obj in objs:
+            model_admin.render_inline_actions(obj)
+
+    benchmark(render_page)
+
+
+def render_with_strings(model_admin, request, obj):
+    """`render_inline_actions` as implemented before templates were used."""
+    scope = model_admin._get_token_scope()
+    buttons = []
+    for action_name in model_admin._get_object_inline_actions(request, obj):
+        action = model_admin._get_action_descriptor(action_name)
+
+        if action.label_handler is None:
+            description = action.label
+        else:
+            description = getattr(model_admin, action.label_handler)(obj=obj)
+
+        if action.css_handler is None:
+            css_classes = action.css_classes
+        else:
+            css_classes = getattr(model_admin, action.css_handler)(obj=obj)
+
+        buttons.append(
+            '<button type="submit" name="{}" value="{}" class="{}">'
+            '{}</button>'.format(
+                TOKEN_FIELD,
+                make_token(action.token_prefix, obj.pk, scope),
+                css_classes,
+                description,
+            )
+        )
+    return mark_safe(
+        '<div class="submit_row inline_actions">{}</div>'.format(''.join(buttons))
+    )
+
+
+def render_with_template(model_admin, request, obj):
+    return model_admin.render_inline_actions(obj)
+
+
+def make_page_renderer(admin_request, dynamic, render):
+    """
+    Returns a function rendering a page of 1000 rows with three actions each
+    using `render`.
+    """
+    model_admin = make_model_admin_class(3, dynamic)(Article, admin.site)
+    objs = [Article(pk=pk, title='Title') for pk in range(1, 1001)]
+
+    def render_page():
+        request = admin_request()
+        model_admin._set_inline_actions_objects(request, objs)
+        for obj in objs:
+            render(model_admin, request, obj)
+
+    return render_page
+
+
+@pytest.mark.parametrize('render', [render_with_strings, render_with_template])
+@pytest.mark.parametrize('dynamic', [False, True], ids=['static', 'dynamic'])
+def test_render_strings_or_template(benchmark, admin_request, dynamic, render):
+    """Compares the template with the string building used before."""
+    benchmark.group = 'render-{}'.format('dynamic' if dynamic else 'static')
+    benchmark(make_page_renderer(admin_request, dynamic, render))
+
+
+@pytest.mark.parametrize('dynamic', [False, True], ids=['static', 'dynamic'])
+def test_template_is_not_slower(admin_request, dynamic):
+    """
+    Rendering the template is not slower than the string building used
+    before, also if the benchmarks are disabled.
+    """
+    pages = {
+        render: make_page_renderer(admin_request, dynamic, render)
+        for render in (render_with_strings, render_with_template)
+    }
+    timings = {render: [] for render in pages}
+    for __ in range(10):
+        # alternate both variants, so both are affected by the same load
+        for render, render_page in pages.items():
+            timings[render].append(timeit.timeit(render_page, number=1))
+
+    strings = min(timings[render_with_strings])
+    template = min(timings[render_with_template])
+    assert template <= strings * MAX_SLOWDOWN, (
+        "Rendering the template took {:.1f} ms, "
+        "building strings took {:.1f} ms".format(template * 1000, strings * 1000)
+    )
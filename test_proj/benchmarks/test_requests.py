@@ -0,0 +1,26 @@
+import pytest
+from django.urls import reverse
+
+
+@pytest.fixture
+def client(client, admin_user):
+    client.force_login(admin_user)
+    return client
+
+
+@pytest.mark.parametrize('rows', [10, 100])
+def test_changelist(benchmark, client, articles, rows):
+    articles(rows)
+    url = reverse('admin:blog_article_changelist')
+
+    response = benchmark(client.get, url, {'all': ''})
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize('rows', [10, 100])
+def test_changeform(benchmark, client, author, articles, rows):
+    articles(rows)
+    url = reverse('admin:blog_author_change', args=(author.pk,))
+
+    response = benchmark(client.get, url)
+    assert response.status_code == 200
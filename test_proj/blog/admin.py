@@ -25,6 +25,7 @@ class UnPublishActionsMixin(object):
         messages.info(request, _("Article published."))
 
     publish.short_description = _("Publish")  # type: ignore
+    publish.ajax = True  # type: ignore
 
     def unpublish(self, request, obj, parent_obj=None):
         obj.status = Article.DRAFT
@@ -32,6 +33,7 @@ class UnPublishActionsMixin(object):
         messages.info(request, _("Article unpublished."))
 
     unpublish.short_description = _("Unpublish")  # type: ignore
+    unpublish.ajax = True  # type: ignore
 
 
 class TogglePublishActionsMixin(object):
@@ -52,6 +54,8 @@ class TogglePublishActionsMixin(object):
         status = 'unpublished' if obj.status == Article.DRAFT else 'published'
         messages.info(request, _("Article {}.".format(status)))
 
+    toggle_publish.ajax = True  # type: ignore
+
     def get_toggle_publish_label(self, obj):
         label = 'publish' if obj.status == Article.DRAFT else 'unpublish'
         return 'Toggle {}'.format(label)
@@ -97,6 +101,8 @@ class ArticleInline(
         'title',
         'status',
     )
+    inline_actions_max_queries = 2
+    inline_actions_max_action_queries = 5
 
     def has_add_permission(self, request, obj=None):
         return False
@@ -148,3 +154,5 @@ class ArticleAdmin(
     admin.ModelAdmin,
 ):
     list_display = ('title', 'status', 'author')
+    inline_actions_max_queries = 2
+    inline_actions_max_action_queries = 5
@@ -0,0 +1,97 @@
+import json
+
+import pytest
+from django.contrib import admin
+from django.contrib.admin.sites import AdminSite
+from django.core.exceptions import ImproperlyConfigured
+
+from inline_actions.actions import ExportAction
+from inline_actions.admin import InlineActionsMixin, InlineActionsModelAdminMixin
+
+from ..models import Article, Author
+
+
+class ExportArticleAdmin(ExportAction, InlineActionsModelAdminMixin, admin.ModelAdmin):
+    export_fields = ['id', 'title', 'author__name']
+
+
+class ExportArticleInline(ExportAction, InlineActionsMixin, admin.TabularInline):
+    model = Article
+    export_fields = ['title', 'status']
+    export_format = 'jsonl'
+
+
+@pytest.fixture
+def model_admin():
+    return ExportArticleAdmin(Article, AdminSite())
+
+
+def get_content(response):
+    return b''.join(response.streaming_content).decode()
+
+
+@pytest.mark.django_db
+def test_export_selected_rows(rf, model_admin, author):
+    articles = [
+        Article.objects.create(author=author, title='Title {}'.format(index))
+        for index in range(3)
+    ]
+    pks = [article.pk for article in articles[:2]]
+
+    request = rf.post('/', {'_selected_action': pks})
+    queryset = model_admin._get_action_target(
+        request, model_admin, 'export_action', str(pks[0])
+    )
+    response = model_admin._execute_action(
+        request, model_admin, 'export_action', queryset
+    )
+
+    assert response['Content-Type'] == 'text/csv; charset=utf-8'
+    assert response['Content-Disposition'] == 'attachment; filename="article.csv"'
+    assert get_content(response).splitlines() == [
+        'id,title,author__name',
+        '{},Title 0,Author'.format(pks[0]),
+        '{},Title 1,Author'.format(pks[1]),
+    ]
+
+
+@pytest.mark.django_db
+def test_export_related_objects_of_inline(rf, admin_user, author, article):
+    other_author = Author.objects.create(name='Other')
+    Article.objects.create(author=other_author, title='Other')
+    Article.objects.create(author=author, title='Second', status=Article.PUBLISHED)
+
+    inline = ExportArticleInline(Author, AdminSite())
+    request = rf.post('/')
+    request.user = admin_user
+    queryset = Article.objects.filter(pk=article.pk)
+    response = inline.export_action(request, queryset, parent_obj=author)
+
+    assert response['Content-Type'] == 'application/x-ndjson; charset=utf-8'
+    lines = [json.loads(line) for line in get_content(response).splitlines()]
+    assert sorted(lines, key=lambda line: line['title']) == [
+        {'title': 'Lorem ipson dolor', 'status': Article.DRAFT},
+        {'title': 'Second', 'status': Article.PUBLISHED},
+    ]
+
+
+@pytest.mark.django_db
+def test_export_all_fields_in_chunks(rf, model_admin, author):
+    for index in range(5):
+        Article.objects.create(author=author, title=str(index))
+    model_admin.export_fields = None
+    model_admin.export_chunk_size = 2
+
+    response = model_admin.export_action(rf.post('/'), Article.objects.order_by('pk'))
+
+    chunks = list(response.streaming_content)
+    # the header and five rows
+    assert len(chunks) == 3
+    header = b''.join(chunks).decode().splitlines()[0]
+    assert header == 'id,author_id,title,body,status'
+
+
+def test_unknown_export_format(rf, model_admin):
+    model_admin.export_format = 'xml'
+    with pytest.raises(ImproperlyConfigured):
+        model_admin.export_action(rf.post('/'), Article.objects.none())
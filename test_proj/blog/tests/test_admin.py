@@ -2,7 +2,10 @@ import pytest
 from django.contrib.admin.sites import AdminSite
 from django.urls import reverse
 
-from test_proj.blog.models import Article
+from inline_actions.tokens import TOKEN_FIELD
+from test_proj.blog.models import Article, Author
+
+from .utils import action_token, rendered_tokens
 
 
 @pytest.fixture
@@ -36,13 +39,14 @@ def test_actions_available(admin_client, author):
 @pytest.mark.django_db
 def test_non_existing_action(admin_site, article):
     """Test for appropriate exception, when `action` is not found."""
+    from inline_actions.utils import set_current_request
     from test_proj.blog.admin import ArticleAdmin
 
     ArticleAdmin.inline_actions = ['non_existing']
     fake_request = {}
 
     admin = ArticleAdmin(article, admin_site)
-    admin._request = fake_request
+    set_current_request(fake_request)
 
     with pytest.raises(RuntimeError):
         admin.render_inline_actions(article)
@@ -90,11 +94,12 @@ def test_actions_rendered(admin_client, article, action):
     url = reverse('admin:blog_author_change', args=(author.pk,))
     changeview = admin_client.get(url)
 
-    input_name = '_action__articleinline__inline__{}__blog__article__{}'.format(
+    input_name = action_token(
+        'articleinline',
         action,
         article.pk,
     )
-    assert input_name in dict(changeview.form.fields)
+    assert input_name in rendered_tokens(changeview.form)
 
 
 def test_publish_action(admin_client, mocker, article):
@@ -108,38 +113,32 @@ def test_publish_action(admin_client, mocker, article):
     assert article.status == Article.DRAFT
 
     author_url = reverse('admin:blog_author_change', args=(author.pk,))
-    publish_input_name = (
-        '_action__articleinline__inline__publish__blog__article__{}'.format(
-            article.pk,
-        )
-    )
-    unpublish_input_name = (
-        '_action__articleinline__inline__unpublish__blog__article__{}'.format(
-            article.pk,
-        )
-    )
+    publish_input_name = action_token('articleinline', 'publish', article.pk)
+    unpublish_input_name = action_token('articleinline', 'unpublish', article.pk)
 
     # open changeform
     changeview = admin_client.get(author_url)
     assert UnPublishActionsMixin.get_inline_actions.call_count > 0
-    assert publish_input_name in dict(changeview.form.fields)
+    assert publish_input_name in rendered_tokens(changeview.form)
 
     # execute and test publish action
-    changeview = changeview.form.submit(name=publish_input_name).follow()
+    changeview = changeview.form.submit(TOKEN_FIELD, value=publish_input_name).follow()
     # not available in django 1.7
     # article.refresh_from_db()
     article = Article.objects.get(pk=article.pk)
-    assert publish_input_name not in dict(changeview.form.fields)
-    assert unpublish_input_name in dict(changeview.form.fields)
+    assert publish_input_name not in rendered_tokens(changeview.form)
+    assert unpublish_input_name in rendered_tokens(changeview.form)
     assert UnPublishActionsMixin.publish.call_count == 1
     assert article.status == Article.PUBLISHED
 
     # execute and test unpublish action
-    changeview = changeview.form.submit(name=unpublish_input_name).follow()
+    changeview = changeview.form.submit(
+        TOKEN_FIELD, value=unpublish_input_name
+    ).follow()
     # article.refresh_from_db()
     article = Article.objects.get(pk=article.pk)
-    assert publish_input_name in dict(changeview.form.fields)
-    assert unpublish_input_name not in dict(changeview.form.fields)
+    assert publish_input_name in rendered_tokens(changeview.form)
+    assert unpublish_input_name not in rendered_tokens(changeview.form)
     assert UnPublishActionsMixin.unpublish.call_count == 1
     assert article.status == Article.DRAFT
 
@@ -155,12 +154,8 @@ def test_view_action(admin_client, mocker, article):
     changeview = admin_client.get(author_url)
 
     # execute and test view action
-    input_name = (
-        '_action__articleinline__inline__view_action__blog__article__{}'.format(
-            article.pk,
-        )
-    )
-    response = changeview.form.submit(name=input_name).follow()
+    input_name = action_token('articleinline', 'view_action', article.pk)
+    response = changeview.form.submit(TOKEN_FIELD, value=input_name).follow()
     assert ViewAction.view_action.call_count == 1
     article_url = reverse('admin:blog_article_change', args=(article.pk,))
     assert response.request.path == article_url
@@ -177,12 +172,8 @@ def test_delete_action_without_permission(admin_client, mocker, article):
     author_url = reverse('admin:blog_author_change', args=(author.pk,))
     changeview = admin_client.get(author_url)
 
-    input_name = (
-        '_action__articleinline__inline__delete_action__blog__article__{}'.format(
-            article.pk,
-        )
-    )
-    assert input_name not in dict(changeview.form.fields)
+    input_name = action_token('articleinline', 'delete_action', article.pk)
+    assert input_name not in rendered_tokens(changeview.form)
 
 
 def test_delete_action(admin_client, mocker, article):
@@ -197,12 +188,8 @@ def test_delete_action(admin_client, mocker, article):
     changeview = admin_client.get(author_url)
 
     # execute and test delete action
-    input_name = (
-        '_action__articleinline__inline__delete_action__blog__article__{}'.format(
-            article.pk,
-        )
-    )
-    response = changeview.form.submit(name=input_name).follow()
+    input_name = action_token('articleinline', 'delete_action', article.pk)
+    response = changeview.form.submit(TOKEN_FIELD, value=input_name).follow()
     assert DeleteAction.delete_action.call_count == 1
     assert response.request.path == author_url
     with pytest.raises(Article.DoesNotExist):
@@ -245,3 +232,557 @@ def test_missing_render_inline_actions_from_readonly_fields(
     # even though `render_inline_actions` is not part of the fields,
     # it should not fail :)
     admin.changeform_view(request)
+
+
+def test_class_inline_actions_are_cached(mocker):
+    """The MRO should only be walked once per admin class."""
+    from test_proj.blog.admin import ArticleAdmin
+
+    ArticleAdmin._get_class_inline_actions()
+
+    mro = mocker.spy(ArticleAdmin, 'mro')
+    assert ArticleAdmin._get_class_inline_actions() == ('view_action',)
+    assert ArticleAdmin._get_class_inline_actions() == ('view_action',)
+    assert mro.call_count == 0
+
+
+@pytest.mark.django_db
+def test_class_inline_actions_are_copied(rf, article):
+    """Dynamic extensions must not leak into the cached actions."""
+    from test_proj.blog.admin import ArticleAdmin
+
+    request = rf.get('/')
+    admin = ArticleAdmin(Article, AdminSite())
+    actions = admin.get_inline_actions(request, article)
+    assert actions == ['view_action', 'change_title', 'toggle_publish', 'publish']
+    assert admin.get_inline_actions(request, article) == actions
+
+
+def test_class_inline_actions_cache_invalidation():
+    """Reassigning `inline_actions` on any class must be picked up."""
+    from inline_actions.actions import ViewAction
+    from test_proj.blog.admin import ArticleAdmin
+
+    assert ArticleAdmin._get_class_inline_actions() == ('view_action',)
+
+    ArticleAdmin.inline_actions = ['publish']
+    try:
+        assert ArticleAdmin._get_class_inline_actions() == ('view_action', 'publish')
+    finally:
+        del ArticleAdmin.inline_actions
+
+    old_actions = ViewAction.inline_actions
+    ViewAction.inline_actions = ['view_action', 'unpublish']
+    try:
+        assert ArticleAdmin._get_class_inline_actions() == (
+            'view_action',
+            'unpublish',
+        )
+    finally:
+        ViewAction.inline_actions = old_actions
+
+    assert ArticleAdmin._get_class_inline_actions() == ('view_action',)
+
+
+def test_action_descriptors():
+    """Static labels/css are compiled, dynamic handlers are referenced by name."""
+    from inline_actions.admin import ActionDescriptor
+    from test_proj.blog.admin import ArticleAdmin, ArticleInline
+
+    view_action = ActionDescriptor(ArticleAdmin, 'view_action')
+    assert view_action.label == 'View'
+    assert view_action.css_classes == ''
+    assert view_action.label_handler is None
+    assert view_action.css_handler is None
+    assert view_action.token_prefix == ':view_action:'
+    assert not hasattr(view_action, '__dict__')
+
+    toggle_publish = ActionDescriptor(ArticleInline, 'toggle_publish')
+    assert toggle_publish.label == 'Toggle publish'
+    assert toggle_publish.label_handler == 'get_toggle_publish_label'
+    assert toggle_publish.css_handler == 'get_toggle_publish_css'
+    assert toggle_publish.token_prefix == 'articleinline:toggle_publish:'
+
+
+@pytest.mark.django_db
+def test_action_descriptors_are_reused(rf, article):
+    from inline_actions.utils import set_current_request
+    from test_proj.blog.admin import ArticleAdmin
+
+    admin = ArticleAdmin(Article, AdminSite())
+    set_current_request(rf.get('/'))
+    admin.render_inline_actions(article)
+
+    descriptors = ArticleAdmin._get_action_descriptors()
+    view_action = descriptors['view_action']
+    assert set(descriptors) == {
+        'view_action',
+        'publish',
+        'toggle_publish',
+        'change_title',
+    }
+
+    admin.render_inline_actions(article)
+    assert ArticleAdmin._get_action_descriptors()['view_action'] is view_action
+
+
+def test_parallel_renders_use_their_own_request(rf):
+    """Concurrent renders on the shared admin instance must not mix requests."""
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from test_proj.blog.admin import ArticleAdmin
+
+    class RecordingArticleAdmin(ArticleAdmin):
+        def get_inline_actions(self, request, obj=None):
+            # give the other threads a chance to bind their request
+            time.sleep(0.001)
+            request.seen.append(obj.pk)
+            return super().get_inline_actions(request, obj)
+
+    admin = RecordingArticleAdmin(Article, AdminSite())
+    threads = 8
+    barrier = threading.Barrier(threads)
+    articles = [Article(pk=pk, title='Article') for pk in range(1, 21)]
+
+    def render(index):
+        request = rf.get('/', {'thread': index})
+        request.seen = []
+        admin.get_list_display(request)
+        barrier.wait()
+        for article in articles:
+            assert 'publish' in admin.render_inline_actions(article)
+        return request.seen
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(render, range(threads)))
+
+    expected = [article.pk for article in articles]
+    assert results == [expected] * threads
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('returns_response', [False, True])
+def test_async_action(rf, article, returns_response):
+    """`async def` actions are awaited and handled like sync actions."""
+    from django.http import HttpResponse
+
+    from test_proj.blog.admin import ArticleAdmin
+
+    class AsyncArticleAdmin(ArticleAdmin):
+        async def async_action(self, request, obj, parent_obj=None):
+            if returns_response:
+                return HttpResponse('async')
+            return None
+
+    request = rf.post('/admin/blog/article/')
+    admin = AsyncArticleAdmin(Article, AdminSite())
+    response = admin._execute_action(request, admin, 'async_action', article)
+
+    if returns_response:
+        assert response.content == b'async'
+    else:
+        assert response.status_code == 302
+        assert response.url == reverse('admin:blog_article_changelist')
+
+
+def test_inline_actions_template_names(admin_site):
+    from test_proj.blog.admin import ArticleAdmin
+
+    model_admin = ArticleAdmin(Article, admin_site)
+    assert model_admin.get_inline_actions_template_names() == [
+        'inline_actions/blog/article/inline_actions.html',
+        'inline_actions/blog/inline_actions.html',
+        'inline_actions/inline_actions.html',
+    ]
+
+    model_admin.inline_actions_template = 'custom_inline_actions.html'
+    assert model_admin.get_inline_actions_template_names()[0] == (
+        'custom_inline_actions.html'
+    )
+
+
+@pytest.mark.django_db
+def test_custom_inline_actions_template(admin_client, mocker, article):
+    from test_proj.blog.admin import ArticleAdmin
+
+    mocker.patch.object(
+        ArticleAdmin, 'inline_actions_template', 'custom_inline_actions.html'
+    )
+    changelist = admin_client.get(reverse('admin:blog_article_changelist'))
+
+    buttons = changelist.lxml.xpath('.//ul[@class="custom_inline_actions"]//button')
+    assert len(buttons) > 0
+    assert action_token('', 'publish', article.pk) in rendered_tokens(changelist.form)
+
+
+def test_inline_actions_template_is_cached(rf, mocker, admin_site):
+    from inline_actions import utils
+    from test_proj.blog.admin import ArticleAdmin
+
+    utils.clear_template_cache()
+    select_template = mocker.spy(utils, 'select_template')
+    utils.set_current_request(rf.get('/'))
+
+    model_admin = ArticleAdmin(Article, admin_site)
+    for pk in range(1, 4):
+        model_admin.render_inline_actions(Article(pk=pk, status=Article.DRAFT))
+
+    assert select_template.call_count == 1
+
+
+def test_labels_are_escaped(rf, mocker, admin_site):
+    from inline_actions.utils import set_current_request
+    from test_proj.blog.admin import ArticleAdmin
+
+    mocker.patch.object(
+        ArticleAdmin, 'get_toggle_publish_label', return_value='<b>Toggle</b>'
+    )
+    set_current_request(rf.get('/'))
+
+    model_admin = ArticleAdmin(Article, admin_site)
+    html = model_admin.render_inline_actions(Article(pk=1, status=Article.DRAFT))
+    assert '&lt;b&gt;Toggle&lt;/b&gt;' in html
+
+
+def test_identical_action_bars_are_rendered_once(rf, mocker, admin_site):
+    from inline_actions import admin
+    from inline_actions.utils import set_current_request
+    from test_proj.blog.admin import ArticleAdmin
+
+    split_placeholders = mocker.spy(admin, 'split_placeholders')
+    set_current_request(rf.get('/'))
+
+    model_admin = ArticleAdmin(Article, admin_site)
+    drafts = [Article(pk=pk, status=Article.DRAFT) for pk in (1, 2, 3)]
+    published = Article(pk=4, status=Article.PUBLISHED)
+    html = [model_admin.render_inline_actions(obj) for obj in drafts + [published]]
+
+    # one for all drafts and one for the published article
+    assert split_placeholders.call_count == 2
+    for obj, row in zip(drafts, html):
+        assert action_token('', 'publish', obj.pk) in row
+        assert 'Toggle publish' in row
+    assert action_token('', 'unpublish', published.pk) in html[-1]
+    assert 'Toggle unpublish' in html[-1]
+
+
+@pytest.mark.django_db
+def test_batched_label_and_css_handlers(rf, admin_site, author):
+    from inline_actions.utils import set_current_request
+    from test_proj.blog.admin import ArticleAdmin
+
+    calls = []
+
+    class BatchedArticleAdmin(ArticleAdmin):
+        def get_toggle_publish_labels(self, request, objs):
+            calls.append([obj.pk for obj in objs])
+            # the last object falls back to `get_toggle_publish_label`
+            return {obj.pk: 'Batched {}'.format(obj.pk) for obj in objs[:-1]}
+
+        def get_toggle_publish_css_classes(self, request, objs):
+            return {obj.pk: 'batched' for obj in objs}
+
+    articles = [
+        Article.objects.create(author=author, title=str(index), body='')
+        for index in range(3)
+    ]
+    request = rf.get('/')
+    set_current_request(request)
+    model_admin = BatchedArticleAdmin(Article, admin_site)
+    model_admin._set_inline_actions_objects(request, articles)
+
+    html = [model_admin.render_inline_actions(obj) for obj in articles]
+
+    assert calls == [[obj.pk for obj in articles]]
+    assert 'Batched {}'.format(articles[0].pk) in html[0]
+    assert 'Batched {}'.format(articles[1].pk) in html[1]
+    assert 'Toggle publish' in html[2]
+    assert all('class="batched"' in row for row in html)
+
+
+def test_batched_label_handler_without_registered_objects(rf, admin_site):
+    from inline_actions.utils import set_current_request
+    from test_proj.blog.admin import ArticleAdmin
+
+    class BatchedArticleAdmin(ArticleAdmin):
+        def get_toggle_publish_labels(self, request, objs):
+            return {obj.pk: 'Batched' for obj in objs}
+
+    set_current_request(rf.get('/'))
+    model_admin = BatchedArticleAdmin(Article, admin_site)
+    html = model_admin.render_inline_actions(Article(pk=1, status=Article.DRAFT))
+    assert 'Batched' in html
+
+
+class RelatedArticleAdminMixin:
+    def get_inline_actions(self, request, obj=None):
+        return super().get_inline_actions(request, obj) + ['show_author']
+
+    def show_author(self, request, obj, parent_obj=None):
+        pass
+
+    show_author.select_related = ('author',)  # type: ignore
+    show_author.prefetch_related = ('author__article_set',)  # type: ignore
+
+    def get_show_author_label(self, obj):
+        return '{} ({})'.format(obj.author.name, len(obj.author.article_set.all()))
+
+
+def test_queryset_hints():
+    from test_proj.blog.admin import ArticleAdmin
+
+    class RelatedArticleAdmin(RelatedArticleAdminMixin, ArticleAdmin):
+        pass
+
+    assert ArticleAdmin._get_queryset_hints() == ((), (), {})
+    assert RelatedArticleAdmin._get_queryset_hints() == (
+        ('author',),
+        ('author__article_set',),
+        {},
+    )
+
+
+def test_queryset_hints_of_overridden_actions():
+    from test_proj.blog.admin import ArticleAdmin
+
+    class RelatedArticleAdmin(RelatedArticleAdminMixin, ArticleAdmin):
+        pass
+
+    class OverridingArticleAdmin(RelatedArticleAdmin):
+        def show_author(self, request, obj, parent_obj=None):
+            pass
+
+        show_author.prefetch_related = ('author',)  # type: ignore
+
+    class HiddenArticleAdmin(VisibilityArticleAdminMixin, ArticleAdmin):
+        def archive(self, request, obj, parent_obj=None):
+            pass
+
+    # only the declarations of the resolved methods are used
+    assert OverridingArticleAdmin._get_queryset_hints() == ((), ('author',), {})
+    assert HiddenArticleAdmin._get_queryset_hints() == ((), (), {})
+
+
+@pytest.mark.django_db
+def test_queryset_hints_are_applied(rf, admin_site, author, django_assert_num_queries):
+    from inline_actions.utils import set_current_request
+    from test_proj.blog.admin import ArticleAdmin
+
+    class RelatedArticleAdmin(RelatedArticleAdminMixin, ArticleAdmin):
+        pass
+
+    for index in range(3):
+        Article.objects.create(author=author, title=str(index), body='')
+    request = rf.get('/')
+    set_current_request(request)
+    model_admin = RelatedArticleAdmin(Article, admin_site)
+
+    # the articles and the prefetched articles of their author
+    with django_assert_num_queries(2):
+        articles = list(model_admin.get_queryset(request))
+        model_admin._set_inline_actions_objects(request, articles)
+        html = [model_admin.render_inline_actions(obj) for obj in articles]
+
+    assert all('Author (3)' in row for row in html)
+
+
+class VisibilityArticleAdminMixin:
+    inline_actions = ['archive']
+
+    def archive(self, request, obj, parent_obj=None):
+        pass
+
+    archive.visible_if = {'status': Article.PUBLISHED}  # type: ignore
+
+
+@pytest.mark.django_db
+def test_visibility_is_annotated(rf, admin_site, author, django_assert_num_queries):
+    from inline_actions.utils import set_current_request
+    from test_proj.blog.admin import ArticleAdmin
+
+    class VisibilityArticleAdmin(VisibilityArticleAdminMixin, ArticleAdmin):
+        pass
+
+    draft = Article.objects.create(author=author, title='draft', body='')
+    published = Article.objects.create(
+        author=author, title='published', body='', status=Article.PUBLISHED
+    )
+    request = rf.get('/')
+    set_current_request(request)
+    model_admin = VisibilityArticleAdmin(Article, admin_site)
+
+    queryset = model_admin._annotate_inline_actions_visibility(
+        model_admin.get_queryset(request).order_by('pk')
+    )
+    with django_assert_num_queries(1):
+        articles = list(queryset)
+        model_admin._set_inline_actions_objects(request, articles)
+        html = [model_admin.render_inline_actions(obj) for obj in articles]
+
+    assert [obj.inline_action_archive_visible for obj in articles] == [False, True]
+    assert action_token('', 'archive', draft.pk) not in html[0]
+    assert action_token('', 'archive', published.pk) in html[1]
+
+
+class VisibilityAuthorAdminMixin:
+    inline_actions = ['notify']
+
+    def notify(self, request, obj, parent_obj=None):
+        pass
+
+    # a condition on a reverse relation, i.e. joining multiple rows
+    notify.visible_if = {'article__status': Article.PUBLISHED}  # type: ignore
+
+
+@pytest.mark.django_db
+def test_visibility_condition_on_reverse_relation(rf, admin_site, author):
+    from inline_actions.utils import set_current_request
+    from test_proj.blog.admin import AuthorAdmin
+
+    class VisibilityAuthorAdmin(VisibilityAuthorAdminMixin, AuthorAdmin):
+        pass
+
+    for index in range(3):
+        Article.objects.create(
+            author=author, title=str(index), body='', status=Article.PUBLISHED
+        )
+    request = rf.get('/')
+    set_current_request(request)
+    model_admin = VisibilityAuthorAdmin(Author, admin_site)
+
+    queryset = model_admin._annotate_inline_actions_visibility(
+        model_admin.get_queryset(request)
+    )
+    assert [obj.inline_action_notify_visible for obj in queryset] == [True]
+
+
+@pytest.mark.django_db
+def test_visibility_without_annotation(
+    rf, admin_site, article, django_assert_num_queries
+):
+    from inline_actions.utils import set_current_request
+    from test_proj.blog.admin import ArticleAdmin
+
+    class VisibilityArticleAdmin(VisibilityArticleAdminMixin, ArticleAdmin):
+        pass
+
+    set_current_request(rf.get('/'))
+    model_admin = VisibilityArticleAdmin(Article, admin_site)
+
+    with django_assert_num_queries(1):
+        html = model_admin.render_inline_actions(article)
+        model_admin.render_inline_actions(article)
+    assert action_token('', 'archive', article.pk) not in html
+
+
+@pytest.mark.django_db
+def test_visibility_is_annotated_to_changelist(rf, admin_user, admin_site, article):
+    from inline_actions.utils import set_current_request
+    from test_proj.blog.admin import ArticleAdmin
+
+    class VisibilityArticleAdmin(VisibilityArticleAdminMixin, ArticleAdmin):
+        pass
+
+    request = rf.get('/')
+    request.user = admin_user
+    set_current_request(request)
+    model_admin = VisibilityArticleAdmin(Article, admin_site)
+
+    changelist = model_admin.get_changelist_instance(request)
+    assert [obj.inline_action_archive_visible for obj in changelist.result_list] == [
+        False
+    ]
+    # e.g. get_object, the delete view and counts are not affected
+    assert not model_admin.get_queryset(request).query.annotations
+
+
+@pytest.mark.django_db
+def test_visibility_is_annotated_to_inline_formset(rf, admin_user, admin_site, article):
+    from inline_actions.utils import set_current_request
+    from test_proj.blog.admin import ArticleInline
+
+    class VisibilityArticleInline(VisibilityArticleAdminMixin, ArticleInline):
+        pass
+
+    request = rf.get('/')
+    request.user = admin_user
+    set_current_request(request)
+    inline = VisibilityArticleInline(Author, admin_site)
+
+    formset = inline.get_formset(request, article.author)(instance=article.author)
+    queryset = formset.get_queryset()
+    assert formset.get_queryset() is queryset
+    assert [obj.inline_action_archive_visible for obj in queryset] == [False]
+    assert not inline.get_queryset(request).query.annotations
+
+
+@pytest.mark.django_db
+def test_visibility_of_action_with_different_attribute(
+    rf, admin_site, article, django_assert_num_queries
+):
+    from inline_actions.utils import set_current_request
+    from test_proj.blog.admin import ArticleAdmin
+
+    class VisibilityArticleAdmin(VisibilityArticleAdminMixin, ArticleAdmin):
+        inline_actions = ['archive_article']
+        archive_article = VisibilityArticleAdminMixin.archive
+
+    assert list(VisibilityArticleAdmin._get_queryset_hints()[2]) == ['archive']
+
+    set_current_request(rf.get('/'))
+    model_admin = VisibilityArticleAdmin(Article, admin_site)
+    article.status = Article.PUBLISHED
+    article.save()
+
+    with django_assert_num_queries(1):
+        html = model_admin.render_inline_actions(article)
+    assert action_token('', 'archive', article.pk) in html
+
+
+@pytest.mark.django_db
+def test_streaming_action(rf, article):
+    from django.http import StreamingHttpResponse
+
+    from test_proj.blog.admin import ArticleAdmin
+
+    consumed = []
+
+    class StreamingArticleAdmin(ArticleAdmin):
+        def export(self, request, obj, parent_obj=None):
+            for line in ('title\n', obj.title + '\n'):
+                consumed.append(line)
+                yield line
+
+        export.content_type = 'text/csv'  # type: ignore
+        export.filename = lambda obj: 'article-{}.csv'.format(obj.pk)  # type: ignore
+
+    request = rf.post('/admin/blog/article/')
+    admin = StreamingArticleAdmin(Article, AdminSite())
+    response = admin._execute_action(request, admin, 'export', article)
+
+    assert isinstance(response, StreamingHttpResponse)
+    assert consumed == []  # nothing is generated before the response is sent
+    assert response['Content-Type'] == 'text/csv'
+    assert response['Content-Disposition'] == (
+        'attachment; filename="article-{}.csv"'.format(article.pk)
+    )
+    assert b''.join(response.streaming_content) == b'title\nLorem ipson dolor\n'
+
+
+@pytest.mark.django_db
+def test_streaming_response_of_action_is_returned(rf, article):
+    from django.http import StreamingHttpResponse
+
+    from test_proj.blog.admin import ArticleAdmin
+
+    class StreamingArticleAdmin(ArticleAdmin):
+        def export(self, request, obj, parent_obj=None):
+            return StreamingHttpResponse(iter(['data']))
+
+    request = rf.post('/admin/blog/article/')
+    admin = StreamingArticleAdmin(Article, AdminSite())
+    response = admin._execute_action(request, admin, 'export', article)
+
+    assert b''.join(response.streaming_content) == b'data'
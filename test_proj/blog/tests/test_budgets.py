@@ -0,0 +1,106 @@
+import pytest
+from django.urls import reverse
+
+from inline_actions.admin import QueryBudgetExceeded
+from inline_actions.testing import assert_constant_queries, enforce_query_budgets
+from inline_actions.tokens import TOKEN_FIELD
+
+from ..admin import ArticleAdmin, ArticleInline
+from ..models import Article
+from .utils import action_token
+
+
+def get_toggle_publish_label(self, obj):
+    Article.objects.count()
+    return 'Label'
+
+
+def test_render_budget_exceeded(admin_client, mocker, article):
+    mocker.patch.object(
+        ArticleAdmin, 'get_toggle_publish_label', get_toggle_publish_label
+    )
+    mocker.patch.object(ArticleAdmin, 'inline_actions_max_queries', 0)
+
+    with pytest.raises(QueryBudgetExceeded) as exc_info:
+        admin_client.get(reverse('admin:blog_article_changelist'))
+
+    assert str(exc_info.value) == (
+        "Rendering the inline actions of `ArticleAdmin` executed 1 queries, "
+        "exceeding the budget of 0:\n"
+        "  - get_toggle_publish_label: 1 queries"
+    )
+
+
+def test_render_budget_applies_to_the_whole_page(admin_client, mocker, author):
+    for index in range(3):
+        Article.objects.create(author=author, title=str(index), body='')
+    mocker.patch.object(
+        ArticleAdmin, 'get_toggle_publish_label', get_toggle_publish_label
+    )
+
+    # one query per row
+    mocker.patch.object(ArticleAdmin, 'inline_actions_max_queries', 3)
+    admin_client.get(reverse('admin:blog_article_changelist'))
+
+    mocker.patch.object(ArticleAdmin, 'inline_actions_max_queries', 2)
+    with pytest.raises(QueryBudgetExceeded):
+        admin_client.get(reverse('admin:blog_article_changelist'))
+
+
+def test_budgets_are_not_enforced_by_default(admin_client, mocker, article):
+    mocker.patch.object(
+        ArticleAdmin, 'get_toggle_publish_label', get_toggle_publish_label
+    )
+    mocker.patch.object(ArticleAdmin, 'inline_actions_max_queries', 0)
+
+    with enforce_query_budgets(False):
+        changelist = admin_client.get(reverse('admin:blog_article_changelist'))
+    assert changelist.status_code == 200
+
+
+def test_action_budget_exceeded(admin_client, mocker, article):
+    def publish(self, request, obj, parent_obj=None):
+        for __ in range(2):
+            Article.objects.count()
+
+    publish.max_queries = 1
+    mocker.patch.object(ArticleInline, 'publish', publish, create=True)
+
+    author_url = reverse('admin:blog_author_change', args=(article.author.pk,))
+    changeview = admin_client.get(author_url)
+    input_name = action_token('articleinline', 'publish', article.pk)
+
+    with pytest.raises(QueryBudgetExceeded) as exc_info:
+        changeview.form.submit(TOKEN_FIELD, value=input_name)
+
+    message = str(exc_info.value)
+    assert message.startswith(
+        "Executing the inline action `publish` of `ArticleInline` executed 2 queries"
+    )
+    assert "  - publish: 2 queries" in message
+
+
+def test_changelist_queries_are_constant(admin_client, author):
+    url = reverse('admin:blog_article_changelist')
+
+    def setup(size):
+        for index in range(Article.objects.count(), size):
+            Article.objects.create(author=author, title=str(index), body='')
+
+    assert_constant_queries(lambda: admin_client.get(url), setup)
+
+
+def test_constant_queries_detects_n_plus_one(admin_client, mocker, author):
+    mocker.patch.object(
+        ArticleAdmin, 'get_toggle_publish_label', get_toggle_publish_label
+    )
+    mocker.patch.object(ArticleAdmin, 'inline_actions_max_queries', None)
+    url = reverse('admin:blog_article_changelist')
+
+    def setup(size):
+        for index in range(Article.objects.count(), size):
+            Article.objects.create(author=author, title=str(index), body='')
+
+    with pytest.raises(AssertionError) as exc_info:
+        assert_constant_queries(lambda: admin_client.get(url), setup, sizes=(1, 3))
+    assert "1 rows: " in str(exc_info.value)
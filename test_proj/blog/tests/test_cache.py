@@ -0,0 +1,127 @@
+import pytest
+from django.contrib import admin
+from django.urls import reverse
+from django.utils import translation
+
+from inline_actions import cache
+from inline_actions.utils import set_current_request
+
+from ..admin import ArticleAdmin
+from ..models import Article
+from .utils import action_token, rendered_tokens
+
+
+@pytest.fixture
+def cached_admin(mocker):
+    mocker.patch.object(ArticleAdmin, 'inline_actions_cache', True)
+    cache._local_cache.clear()
+    yield ArticleAdmin(Article, admin.site)
+    cache._local_cache.clear()
+
+
+@pytest.fixture
+def render(rf, admin_user):
+    def render(model_admin, obj, user=admin_user):
+        request = rf.get('/')
+        request.user = user
+        set_current_request(request)
+        return model_admin.render_inline_actions(obj)
+
+    yield render
+    set_current_request(None)
+
+
+@pytest.mark.django_db
+def test_cache_is_disabled_by_default(rf, mocker, article):
+    get_fragment_cache = mocker.spy(cache, 'get_fragment_cache')
+    set_current_request(rf.get('/'))
+
+    ArticleAdmin(Article, admin.site).render_inline_actions(article)
+    assert get_fragment_cache.call_count == 0
+
+
+def test_cached_fragment_is_reused(mocker, cached_admin, render, article):
+    get_inline_actions = mocker.spy(ArticleAdmin, 'get_inline_actions')
+
+    html = render(cached_admin, article)
+    assert get_inline_actions.call_count == 1
+
+    assert render(cached_admin, article) == html
+    assert get_inline_actions.call_count == 1
+
+
+def test_changelist_only_computes_missing_rows(
+    admin_client, mocker, cached_admin, author
+):
+    articles = [
+        Article.objects.create(author=author, title=str(i), body='') for i in range(3)
+    ]
+    url = reverse('admin:blog_article_changelist')
+    admin_client.get(url)
+
+    batch = mocker.spy(ArticleAdmin, 'get_inline_actions_for_objects')
+    articles[0].save()
+    changelist = admin_client.get(url)
+
+    assert batch.call_count == 1
+    assert list(batch.call_args[0][2]) == [articles[0]]
+    for article in articles:
+        token = action_token('', 'publish', article.pk)
+        assert token in rendered_tokens(changelist.form)
+
+
+def test_save_invalidates_fragment(cached_admin, render, article):
+    assert 'Toggle publish' in render(cached_admin, article)
+
+    article.status = Article.PUBLISHED
+    article.save()
+    assert 'Toggle unpublish' in render(cached_admin, article)
+
+
+def test_delete_invalidates_fragment(cached_admin, render, article):
+    render(cached_admin, article)
+    versions = cache.get_versions(cache._local_cache, Article, [article.pk])
+
+    Article.objects.filter(pk=article.pk).delete()
+    assert cache.get_versions(cache._local_cache, Article, [article.pk]) != versions
+
+
+def test_version_field(mocker, cached_admin, render, article):
+    mocker.patch.object(cached_admin, 'inline_actions_cache_version_field', 'status')
+    assert 'Toggle publish' in render(cached_admin, article)
+
+    # `update` does not send any signals
+    Article.objects.filter(pk=article.pk).update(status=Article.PUBLISHED)
+    article.refresh_from_db()
+    assert 'Toggle unpublish' in render(cached_admin, article)
+
+
+def test_fragments_per_language(mocker, cached_admin, render, article):
+    get_inline_actions = mocker.spy(ArticleAdmin, 'get_inline_actions')
+
+    render(cached_admin, article)
+    with translation.override('de'):
+        render(cached_admin, article)
+    assert get_inline_actions.call_count == 2
+
+
+def test_fragments_per_permissions(
+    mocker, django_user_model, cached_admin, render, admin_user, article
+):
+    get_inline_actions = mocker.spy(ArticleAdmin, 'get_inline_actions')
+    staff_user = django_user_model.objects.create(username='staff', is_staff=True)
+
+    render(cached_admin, article, user=admin_user)
+    render(cached_admin, article, user=staff_user)
+    assert get_inline_actions.call_count == 2
+
+
+def test_cache_alias(mocker, cached_admin, render, article):
+    from django.core.cache import caches
+
+    mocker.patch.object(cached_admin, 'inline_actions_cache_alias', 'default')
+    caches['default'].clear()
+
+    render(cached_admin, article)
+    assert len(caches['default']._cache) == 2  # version and fragment
+    assert len(cache._local_cache._cache) == 0
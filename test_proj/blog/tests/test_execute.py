@@ -0,0 +1,146 @@
+import pytest
+from django.urls import reverse
+
+from inline_actions.tokens import TOKEN_FIELD
+
+from ..models import Article
+from .utils import action_token
+
+
+@pytest.fixture
+def client(client, admin_user):
+    client.force_login(admin_user)
+    return client
+
+
+def execute_url(object_id=None):
+    args = () if object_id is None else (object_id,)
+    return reverse('admin:blog_article_inline_actions_execute', args=args)
+
+
+def test_execute_url_is_rendered(admin_client, article):
+    changelist = admin_client.get(reverse('admin:blog_article_changelist'))
+    (bar,) = changelist.lxml.xpath('.//div[contains(@class, "inline_actions")]')
+    assert bar.get('data-execute-url') == execute_url()
+
+    # only actions with `ajax = True` use the json endpoint
+    (change_title,) = bar.xpath('.//button[text()="Change title"]')
+    assert change_title.get('data-ajax') is None
+    assert bar.xpath('.//button[text()="Publish"]')[0].get('data-ajax') is not None
+
+
+def test_execute_url_is_rendered_for_inlines(admin_client, article):
+    author = article.author
+    changeform = admin_client.get(
+        reverse('admin:blog_author_change', args=(author.pk,))
+    )
+    (bar,) = changeform.lxml.xpath('.//div[contains(@class, "inline_actions")]')
+    assert bar.get('data-execute-url') == reverse(
+        'admin:blog_author_inline_actions_execute', args=(author.pk,)
+    )
+
+
+def test_execute_action(client, article):
+    data = {
+        TOKEN_FIELD: action_token('', 'publish', article.pk),
+        '_inline_actions_render': 1,
+    }
+    response = client.post(execute_url(), data)
+
+    result = response.json()
+    assert result['status'] == 'ok'
+    assert result['messages'] == [
+        {'level': 20, 'tags': 'info', 'message': 'Article published.'}
+    ]
+    assert result['redirect'] is None
+    assert action_token('', 'unpublish', article.pk) in result['actions']
+    assert result['actions'].startswith('<div class="submit_row inline_actions"')
+
+    article.refresh_from_db()
+    assert article.status == Article.PUBLISHED
+
+
+def test_execute_inline_action(client, article):
+    author = article.author
+    url = reverse('admin:blog_author_inline_actions_execute', args=(author.pk,))
+    data = {
+        TOKEN_FIELD: action_token('articleinline', 'publish', article.pk),
+        '_inline_actions_render': 1,
+    }
+    response = client.post(url, data)
+
+    result = response.json()
+    assert result['redirect'] is None
+    assert action_token('articleinline', 'unpublish', article.pk) in result['actions']
+    assert 'data-execute-url="{}"'.format(url) in result['actions']
+
+
+def test_execute_without_actions(client, article):
+    data = {TOKEN_FIELD: action_token('', 'publish', article.pk)}
+    response = client.post(execute_url(), data)
+    assert response.json()['actions'] is None
+
+
+def test_messages_are_kept_for_reload(client, article):
+    data = {TOKEN_FIELD: action_token('', 'publish', article.pk)}
+    result = client.post(execute_url(), data).json()
+    assert result['actions'] is None
+    assert result['messages'] == []
+
+    changelist = client.get(reverse('admin:blog_article_changelist'))
+    messages = [str(message) for message in changelist.context['messages']]
+    assert messages == ['Article published.']
+
+
+def test_execute_redirecting_action(client, article):
+    data = {
+        TOKEN_FIELD: action_token('', 'view_action', article.pk),
+        '_inline_actions_render': 1,
+    }
+    result = client.post(execute_url(), data).json()
+    assert result['redirect'] == reverse(
+        'admin:blog_article_change', args=(article.pk,)
+    )
+    assert result['actions'] is None
+
+
+def test_execute_deleting_action(client, article):
+    author = article.author
+    url = reverse('admin:blog_author_inline_actions_execute', args=(author.pk,))
+    data = {
+        TOKEN_FIELD: action_token('articleinline', 'delete_action', article.pk),
+        '_inline_actions_render': 1,
+    }
+    response = client.post(url, data)
+
+    result = response.json()
+    assert result['actions'] is None
+    assert not Article.objects.filter(pk=article.pk).exists()
+
+
+def test_execute_action_with_response(client, article):
+    data = {TOKEN_FIELD: action_token('', 'change_title', article.pk)}
+    response = client.post(execute_url(), data)
+    assert response['Content-Type'].startswith('text/html')
+    assert b'<form' in response.content
+
+
+def test_execute_requires_post(client):
+    assert client.get(execute_url()).status_code == 405
+
+
+def test_execute_requires_token(client):
+    assert client.post(execute_url()).status_code == 400
+
+
+@pytest.mark.django_db
+def test_execute_requires_staff(client, django_user_model, article):
+    user = django_user_model.objects.create_user(username='user', password='secret')
+    client.force_login(user)
+
+    data = {TOKEN_FIELD: action_token('', 'publish', article.pk)}
+    response = client.post(execute_url(), data)
+    assert response.status_code == 302
+
+    article.refresh_from_db()
+    assert article.status == Article.DRAFT
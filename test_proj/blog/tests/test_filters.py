@@ -0,0 +1,76 @@
+import pytest
+from django.contrib.admin.sites import AdminSite
+
+from inline_actions.filters import InlineActionListFilter
+
+from ..admin import ArticleAdmin, AuthorAdmin
+from ..models import Article, Author
+
+
+class VisibilityArticleAdmin(ArticleAdmin):
+    inline_actions = ['archive']
+
+    def archive(self, request, obj, parent_obj=None):
+        pass
+
+    archive.short_description = 'Archive'  # type: ignore
+    archive.visible_if = {'status': Article.PUBLISHED}  # type: ignore
+
+
+@pytest.fixture
+def model_admin():
+    return VisibilityArticleAdmin(Article, AdminSite())
+
+
+def test_lookups(rf, model_admin):
+    list_filter = InlineActionListFilter(rf.get('/'), {}, Article, model_admin)
+    assert list_filter.lookup_choices == [('archive', 'Archive')]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'value, expected',
+    [
+        ('archive', ['published']),
+        ('unknown', ['draft', 'published']),
+    ],
+)
+def test_filter_by_available_action(rf, model_admin, author, value, expected):
+    Article.objects.create(author=author, title='draft', body='')
+    Article.objects.create(
+        author=author, title='published', body='', status=Article.PUBLISHED
+    )
+    request = rf.get('/')
+    list_filter = InlineActionListFilter(
+        request, {'inline_action': value}, Article, model_admin
+    )
+
+    queryset = model_admin.get_queryset(request).order_by('pk')
+    queryset = list_filter.queryset(request, queryset) or queryset
+    assert [obj.title for obj in queryset] == expected
+
+
+class VisibilityAuthorAdmin(AuthorAdmin):
+    inline_actions = ['notify']
+
+    def notify(self, request, obj, parent_obj=None):
+        pass
+
+    notify.visible_if = {'article__status': Article.PUBLISHED}  # type: ignore
+
+
+@pytest.mark.django_db
+def test_filter_by_condition_on_reverse_relation(rf, author):
+    for index in range(3):
+        Article.objects.create(
+            author=author, title=str(index), body='', status=Article.PUBLISHED
+        )
+    Author.objects.create(name='without articles')
+    request = rf.get('/')
+    model_admin = VisibilityAuthorAdmin(Author, AdminSite())
+    list_filter = InlineActionListFilter(
+        request, {'inline_action': 'notify'}, Author, model_admin
+    )
+
+    queryset = list_filter.queryset(request, model_admin.get_queryset(request))
+    assert list(queryset) == [author]
@@ -1,25 +1,27 @@
 import pytest
 from django.urls import reverse
 
+from inline_actions.tokens import TOKEN_FIELD
+
+from .utils import action_token
+
 
 @pytest.mark.django_db
 def test_changetitle_action(admin_client, mocker, article):
     """Test action with intermediate form."""
     new_title = 'Fooo bar!'
-    action_name = (
-        '_action__articleadmin__admin__change_title__blog__article__{}'.format(
-            article.pk
-        )
-    )
+    action_name = action_token('', 'change_title', article.pk)
 
     article_url = reverse('admin:blog_article_changelist')
     changeview = admin_client.get(article_url)
 
-    changetitle_view = changeview.form.submit(name=action_name)
+    changetitle_view = changeview.form.submit(TOKEN_FIELD, value=action_name)
     assert changetitle_view.status_code == 200
 
     # action should be available as hidden field
-    expected_field = '<input type="hidden" name="{}" value="">'.format(action_name)
+    expected_field = '<input type="hidden" name="{}" value="{}">'.format(
+        TOKEN_FIELD, action_name
+    )
     assert expected_field in changetitle_view.text
 
     # change title and save
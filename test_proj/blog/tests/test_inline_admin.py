@@ -1,8 +1,15 @@
+import django
 import pytest
 from django.urls import reverse
 from django_webtest import DjangoTestApp, WebTestMixin
 
+from inline_actions.tokens import TOKEN_FIELD
+
 from ..models import Article, Author
+from .utils import action_token, rendered_tokens
+
+# tokens of the inlines of `AuthorMultipleInlinesAdmin`
+PROXY_SCOPE = 'admin:blog.authorproxy'
 
 
 @pytest.fixture(scope='function')
@@ -105,10 +112,8 @@ def test_actions_rendered(admin_client, article, action):
     url = reverse('admin:blog_author_change', args=(author.pk,))
     changeview = admin_client.get(url)
 
-    input_name = '_action__articleinline__inline__{}__blog__article__{}'.format(
-        action, article.pk
-    )
-    assert input_name in dict(changeview.form.fields)
+    input_name = action_token('articleinline', action, article.pk)
+    assert input_name in rendered_tokens(changeview.form)
 
 
 def test_publish_action(admin_client, mocker, article):
@@ -122,36 +127,32 @@ def test_publish_action(admin_client, mocker, article):
     assert article.status == Article.DRAFT
 
     author_url = reverse('admin:blog_author_change', args=(author.pk,))
-    publish_input_name = (
-        '_action__articleinline__inline__publish__blog__article__{}'.format(article.pk)
-    )
-    unpublish_input_name = (
-        '_action__articleinline__inline__unpublish__blog__article__{}'.format(
-            article.pk
-        )
-    )
+    publish_input_name = action_token('articleinline', 'publish', article.pk)
+    unpublish_input_name = action_token('articleinline', 'unpublish', article.pk)
 
     # open changeform
     changeview = admin_client.get(author_url)
     assert UnPublishActionsMixin.get_inline_actions.call_count > 0
-    assert publish_input_name in dict(changeview.form.fields)
+    assert publish_input_name in rendered_tokens(changeview.form)
 
     # execute and test publish action
-    changeview = changeview.form.submit(name=publish_input_name).follow()
+    changeview = changeview.form.submit(TOKEN_FIELD, value=publish_input_name).follow()
     # not available in django 1.7
     # article.refresh_from_db()
     article = Article.objects.get(pk=article.pk)
-    assert publish_input_name not in dict(changeview.form.fields)
-    assert unpublish_input_name in dict(changeview.form.fields)
+    assert publish_input_name not in rendered_tokens(changeview.form)
+    assert unpublish_input_name in rendered_tokens(changeview.form)
     assert UnPublishActionsMixin.publish.call_count == 1
     assert article.status == Article.PUBLISHED
 
     # execute and test unpublish action
-    changeview = changeview.form.submit(name=unpublish_input_name).follow()
+    changeview = changeview.form.submit(
+        TOKEN_FIELD, value=unpublish_input_name
+    ).follow()
     # article.refresh_from_db()
     article = Article.objects.get(pk=article.pk)
-    assert publish_input_name in dict(changeview.form.fields)
-    assert unpublish_input_name not in dict(changeview.form.fields)
+    assert publish_input_name in rendered_tokens(changeview.form)
+    assert unpublish_input_name not in rendered_tokens(changeview.form)
     assert UnPublishActionsMixin.unpublish.call_count == 1
     assert article.status == Article.DRAFT
 
@@ -167,12 +168,8 @@ def test_view_action(admin_client, mocker, article):
     changeview = admin_client.get(author_url)
 
     # execute and test view action
-    input_name = (
-        '_action__articleinline__inline__view_action__blog__article__{}'.format(
-            article.pk,
-        )
-    )
-    response = changeview.form.submit(name=input_name).follow()
+    input_name = action_token('articleinline', 'view_action', article.pk)
+    response = changeview.form.submit(TOKEN_FIELD, value=input_name).follow()
     assert ViewAction.view_action.call_count == 1
     article_url = reverse('admin:blog_article_change', args=(article.pk,))
     assert response.request.path == article_url
@@ -189,12 +186,26 @@ def test_delete_action_without_permission(admin_client, mocker, article):
     author_url = reverse('admin:blog_author_change', args=(author.pk,))
     changeview = admin_client.get(author_url)
 
-    input_name = (
-        '_action__articleinline__inline__delete_action__blog__article__{}'.format(
-            article.pk,
-        )
-    )
-    assert input_name not in dict(changeview.form.fields)
+    input_name = action_token('articleinline', 'delete_action', article.pk)
+    assert input_name not in rendered_tokens(changeview.form)
+
+
+@pytest.mark.django_db
+def test_get_inline_actions_checks_delete_permission(rf, mocker, admin_user, article):
+    """`get_inline_actions` only lists the delete action with permission."""
+    from django.contrib.admin.sites import AdminSite
+
+    from ..admin import ArticleInline
+
+    inline = ArticleInline(Author, AdminSite())
+    request = rf.get('/')
+    request.user = admin_user
+    assert 'delete_action' in inline.get_inline_actions(request, article)
+
+    mocker.patch.object(ArticleInline, 'has_delete_permission', return_value=False)
+    request = rf.get('/')
+    request.user = admin_user
+    assert 'delete_action' not in inline.get_inline_actions(request, article)
 
 
 def test_delete_action(admin_client, mocker, article):
@@ -209,12 +220,8 @@ def test_delete_action(admin_client, mocker, article):
     changeview = admin_client.get(author_url)
 
     # execute and test delete action
-    input_name = (
-        '_action__articleinline__inline__delete_action__blog__article__{}'.format(
-            article.pk,
-        )
-    )
-    response = changeview.form.submit(name=input_name).follow()
+    input_name = action_token('articleinline', 'delete_action', article.pk)
+    response = changeview.form.submit(TOKEN_FIELD, value=input_name).follow()
     assert DeleteAction.delete_action.call_count == 1
     assert response.request.path == author_url
     with pytest.raises(Article.DoesNotExist):
@@ -235,10 +242,298 @@ def test_handle_multiple_inlines(admin_client, mocker, article):
     changeview = admin_client.get(author_url)
 
     # run action on second inline
-    input_name = (
-        '_action__articlenoopinline__inline__noop_action__blog__article__{}'.format(
-            article.pk,
-        )
+    input_name = action_token(
+        'articlenoopinline', 'noop_action', article.pk, PROXY_SCOPE
     )
-    changeview.form.submit(name=input_name).follow()
+    changeview.form.submit(TOKEN_FIELD, value=input_name).follow()
     assert ArticleNoopInline.noop_action.call_count == 1
+
+
+def test_actions_computed_once_per_formset(admin_client, mocker, author):
+    """The actions of all inline rows are computed using a single batch call."""
+    from ..admin import ArticleInline
+
+    for i in range(3):
+        Article.objects.create(author=author, title='Article {}'.format(i))
+
+    batch = mocker.spy(ArticleInline, 'get_inline_actions_for_objects')
+
+    url = reverse('admin:blog_author_change', args=(author.pk,))
+    admin_client.get(url)
+
+    assert batch.call_count == 1
+    assert len(batch.call_args[0][2]) == 3
+
+
+@pytest.mark.django_db
+def test_permissions_are_cached_per_request(rf, mocker, admin_user, article):
+    """Permission checks of actions are evaluated once per request."""
+    from django.contrib.admin.sites import AdminSite
+
+    from ..admin import ArticleInline
+
+    has_delete_permission = mocker.spy(ArticleInline, 'has_delete_permission')
+    inline = ArticleInline(Author, AdminSite())
+    request = rf.get('/')
+    request.user = admin_user
+
+    assert inline.has_inline_action_permission(request, 'delete', article)
+    assert inline.has_inline_action_permission(request, 'delete', article)
+    assert has_delete_permission.call_count == 1
+
+    other_request = rf.get('/')
+    other_request.user = admin_user
+    assert inline.has_inline_action_permission(other_request, 'delete', article)
+    assert has_delete_permission.call_count == 2
+
+
+def test_permissions_are_checked_per_page(admin_client, mocker, author):
+    """Object permissions of a whole page are resolved by a single call."""
+    from ..admin import ArticleInline
+
+    articles = [
+        Article.objects.create(author=author, title='Article {}'.format(i))
+        for i in range(3)
+    ]
+    denied = articles[0]
+
+    def get_inline_action_permissions(request, permission, objs):
+        return {obj.pk: obj.pk != denied.pk for obj in objs}
+
+    batch = mocker.patch.object(
+        ArticleInline,
+        'get_inline_action_permissions',
+        side_effect=get_inline_action_permissions,
+    )
+
+    author_url = reverse('admin:blog_author_change', args=(author.pk,))
+    changeview = admin_client.get(author_url)
+
+    assert batch.call_count == 1
+    tokens = rendered_tokens(changeview.form)
+    assert action_token('articleinline', 'delete_action', denied.pk) not in tokens
+    for article in articles[1:]:
+        assert action_token('articleinline', 'delete_action', article.pk) in tokens
+
+
+def test_delete_action_permission_denied(admin_client, mocker, article):
+    """Executing an action without sufficient permission is rejected."""
+    from ..admin import ArticleInline
+
+    author = article.author
+    author_url = reverse('admin:blog_author_change', args=(author.pk,))
+    changeview = admin_client.get(author_url)
+
+    mocker.patch.object(ArticleInline, 'has_delete_permission', return_value=False)
+    input_name = action_token('articleinline', 'delete_action', article.pk)
+    response = changeview.form.submit(TOKEN_FIELD, value=input_name, expect_errors=True)
+    assert response.status_code == 403
+    assert Article.objects.filter(pk=article.pk).exists()
+
+
+async def async_noop_action(self, request, obj, parent_obj=None):
+    from asgiref.sync import sync_to_async
+
+    obj.title = 'async'
+    await sync_to_async(obj.save)()
+
+
+def test_async_action(admin_client, mocker, article):
+    """`async def` actions are supported under WSGI."""
+    from ..admin import ArticleNoopInline
+
+    async_noop_action.__name__ = 'noop_action'
+    mocker.patch.object(ArticleNoopInline, 'noop_action', async_noop_action)
+    author = article.author
+
+    author_url = reverse('admin:blog_authorproxy_change', args=(author.pk,))
+    changeview = admin_client.get(author_url)
+
+    input_name = action_token(
+        'articlenoopinline', 'noop_action', article.pk, PROXY_SCOPE
+    )
+    response = changeview.form.submit(TOKEN_FIELD, value=input_name)
+    assert response.status_code == 302
+    assert response['Location'] == author_url
+    article.refresh_from_db()
+    assert article.title == 'async'
+
+
+@pytest.mark.skipif(django.VERSION < (3, 1), reason="requires async views")
+def test_async_action_under_asgi(mocker, admin_user, article):
+    """`async def` actions are supported under ASGI."""
+    from urllib.parse import urlencode
+
+    from asgiref.sync import async_to_sync
+    from django.test import AsyncClient
+
+    from ..admin import ArticleNoopInline
+
+    async_noop_action.__name__ = 'noop_action'
+    mocker.patch.object(ArticleNoopInline, 'noop_action', async_noop_action)
+    author = article.author
+
+    client = AsyncClient()
+    client.force_login(admin_user)
+    author_url = reverse('admin:blog_authorproxy_change', args=(author.pk,))
+    input_name = action_token(
+        'articlenoopinline', 'noop_action', article.pk, PROXY_SCOPE
+    )
+
+    async def post():
+        return await client.post(
+            author_url,
+            urlencode({TOKEN_FIELD: input_name}),
+            content_type='application/x-www-form-urlencoded',
+        )
+
+    response = async_to_sync(post)()
+
+    assert response.status_code == 302
+    assert response['Location'] == author_url
+    article.refresh_from_db()
+    assert article.title == 'async'
+
+
+def test_only_target_inline_is_instantiated(admin_client, mocker, article):
+    """Dispatching an action must not instantiate all inlines."""
+    from ..admin import ArticleInline, AuthorMultipleInlinesAdmin
+
+    author = article.author
+    author_url = reverse('admin:blog_authorproxy_change', args=(author.pk,))
+    changeview = admin_client.get(author_url)
+
+    get_inline_instances = mocker.spy(
+        AuthorMultipleInlinesAdmin, 'get_inline_instances'
+    )
+    article_inline_init = mocker.spy(ArticleInline, '__init__')
+
+    input_name = action_token(
+        'articlenoopinline', 'noop_action', article.pk, PROXY_SCOPE
+    )
+    changeview.form.submit(TOKEN_FIELD, value=input_name)
+
+    assert get_inline_instances.call_count == 0
+    assert article_inline_init.call_count == 0
+
+
+def test_unknown_inline(admin_client, article):
+    """An action for an unknown inline results in a bad request."""
+    author = article.author
+    author_url = reverse('admin:blog_author_change', args=(author.pk,))
+    changeview = admin_client.get(author_url)
+
+    input_name = action_token('articlenoopinline', 'noop_action', article.pk)
+    response = admin_client.post(
+        author_url,
+        {
+            TOKEN_FIELD: input_name,
+            'csrfmiddlewaretoken': changeview.form['csrfmiddlewaretoken'].value,
+        },
+        expect_errors=True,
+    )
+    assert response.status_code == 400
+
+
+def test_parent_object_not_loaded_if_unused(admin_client, mocker, article):
+    """The parent object is only loaded, if the action uses it."""
+    from ..admin import AuthorMultipleInlinesAdmin
+
+    author = article.author
+    author_url = reverse('admin:blog_authorproxy_change', args=(author.pk,))
+    changeview = admin_client.get(author_url)
+
+    get_object = mocker.spy(AuthorMultipleInlinesAdmin, 'get_object')
+
+    input_name = action_token(
+        'articlenoopinline', 'noop_action', article.pk, PROXY_SCOPE
+    )
+    response = changeview.form.submit(TOKEN_FIELD, value=input_name)
+
+    assert get_object.call_count == 0
+    assert response.status_code == 302
+    assert response['Location'] == author_url
+
+
+def test_parent_object_loaded_on_use(admin_client, mocker, article):
+    from ..admin import ArticleNoopInline, AuthorMultipleInlinesAdmin
+
+    author = article.author
+    author_url = reverse('admin:blog_authorproxy_change', args=(author.pk,))
+    changeview = admin_client.get(author_url)
+
+    parent_names = []
+
+    def noop_action(self, request, obj, parent_obj=None):
+        parent_names.append(parent_obj.name)
+
+    mocker.patch.object(ArticleNoopInline, 'noop_action', noop_action)
+    get_object = mocker.spy(AuthorMultipleInlinesAdmin, 'get_object')
+
+    input_name = action_token(
+        'articlenoopinline', 'noop_action', article.pk, PROXY_SCOPE
+    )
+    response = changeview.form.submit(TOKEN_FIELD, value=input_name)
+
+    assert parent_names == [author.name]
+    assert get_object.call_count == 1
+    assert response['Location'] == author_url
+
+
+def test_loaded_parent_object_is_reused(
+    rf, admin_user, django_assert_num_queries, article
+):
+    """A parent object loaded by an action is handed over to `get_object`."""
+    from django.contrib import admin
+
+    from ..admin import AuthorMultipleInlinesAdmin
+
+    author = article.author
+    request = rf.get('/')
+    request.user = admin_user
+    model_admin = AuthorMultipleInlinesAdmin(author.__class__, admin.site)
+
+    object_id = str(author.pk)
+    parent_obj = model_admin._get_lazy_parent_object(request, object_id)
+    assert parent_obj.name == author.name
+
+    with django_assert_num_queries(0):
+        obj = model_admin.get_object(request, object_id)
+    assert obj is parent_obj._wrapped
+
+    # only handed over once
+    with django_assert_num_queries(1):
+        model_admin.get_object(request, object_id)
+
+
+def test_regular_save_skips_action_handling(admin_client, mocker, article):
+    """Saving the change form does not resolve any action."""
+    from inline_actions import admin as inline_actions_admin
+
+    author = article.author
+    author_url = reverse('admin:blog_author_change', args=(author.pk,))
+    changeview = admin_client.get(author_url)
+
+    parse_token = mocker.spy(inline_actions_admin, 'parse_token')
+    response = changeview.form.submit('_continue')
+
+    assert response.status_code == 302
+    assert parse_token.call_count == 0
+
+
+def test_multiple_tokens(admin_client, article):
+    """Posting multiple tokens at once results in a bad request."""
+    author = article.author
+    author_url = reverse('admin:blog_author_change', args=(author.pk,))
+    changeview = admin_client.get(author_url)
+
+    input_name = action_token('articleinline', 'publish', article.pk)
+    response = admin_client.post(
+        author_url,
+        {
+            TOKEN_FIELD: [input_name, input_name],
+            'csrfmiddlewaretoken': changeview.form['csrfmiddlewaretoken'].value,
+        },
+        expect_errors=True,
+    )
+    assert response.status_code == 400
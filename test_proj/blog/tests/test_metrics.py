@@ -0,0 +1,130 @@
+import pytest
+from django.urls import NoReverseMatch, reverse
+
+from inline_actions.metrics import MetricsRegistry, get_admin_label
+from inline_actions.tokens import TOKEN_FIELD
+
+from ..admin import ArticleAdmin, ArticleInline
+from ..models import Article
+from .utils import action_token
+
+ADMIN_LABEL = 'test_proj.blog.admin.ArticleAdmin'
+
+
+@pytest.fixture
+def registry(mocker):
+    registry = MetricsRegistry()
+    mocker.patch('inline_actions.admin.metrics_registry', registry)
+    mocker.patch('inline_actions.metrics.registry', registry)
+    registry.connect(ArticleAdmin)
+    registry.connect(ArticleInline)
+    yield registry
+    registry.disconnect(ArticleAdmin)
+    registry.disconnect(ArticleInline)
+
+
+def test_admin_label():
+    assert get_admin_label(ArticleAdmin) == ADMIN_LABEL
+
+
+def test_action_histogram():
+    registry = MetricsRegistry()
+    for duration in (0.001, 0.002, 0.2, 20):
+        registry.observe_action('admin', 'publish', duration)
+    registry.observe_action('admin', 'publish', 0.003, error=True)
+
+    stats = registry.get_action_stats('admin', 'publish')
+    assert stats.calls == 5
+    assert stats.errors == 1
+    assert stats.quantile(0.5) == 0.005
+    assert stats.quantile(0.8) == 0.25
+    assert stats.quantile(1) is None
+    assert registry.get_action_names('admin') == ['publish']
+
+
+def test_prometheus_export():
+    registry = MetricsRegistry()
+    registry.observe_action('admin', 'publish', 0.02)
+    registry.observe_render('admin', 4, 0.5)
+
+    lines = registry.to_prometheus().splitlines()
+    assert '# TYPE inline_actions_action_duration_seconds histogram' in lines
+    assert (
+        'inline_actions_action_calls_total{admin="admin",action="publish"} 1' in lines
+    )
+    assert (
+        'inline_actions_action_duration_seconds_bucket'
+        '{admin="admin",action="publish",le="0.01"} 0'
+    ) in lines
+    assert (
+        'inline_actions_action_duration_seconds_bucket'
+        '{admin="admin",action="publish",le="+Inf"} 1'
+    ) in lines
+    assert 'inline_actions_render_rows_total{admin="admin"} 4' in lines
+
+
+def test_collects_action_metrics(admin_client, registry, article):
+    changelist = admin_client.get(reverse('admin:blog_article_changelist'))
+    changelist.form.submit(TOKEN_FIELD, value=action_token('', 'publish', article.pk))
+
+    stats = registry.get_action_stats(ADMIN_LABEL, 'publish')
+    assert stats.calls == 1
+    assert stats.errors == 0
+    assert stats.duration > 0
+
+
+def test_collects_render_metrics(admin_client, registry, author):
+    for index in range(3):
+        Article.objects.create(author=author, title=str(index), body='')
+
+    admin_client.get(reverse('admin:blog_article_changelist'))
+
+    stats = registry.get_render_stats(ADMIN_LABEL)
+    assert stats.pages == 1
+    assert stats.rows == 3
+    assert stats.per_row > 0
+
+
+def test_diagnostics_view(admin_client, registry, article):
+    url = reverse('admin:blog_article_inline_actions_diagnostics')
+    changelist = admin_client.get(reverse('admin:blog_article_changelist'))
+    changelist.form.submit(TOKEN_FIELD, value=action_token('', 'publish', article.pk))
+
+    response = admin_client.get(url)
+    assert ADMIN_LABEL in response.text
+    assert 'test_proj.blog.admin.ArticleInline' in response.text
+    assert 'view_action' in response.text
+
+    (publish,) = [
+        action
+        for diagnostics in response.context['admins']
+        if diagnostics['label'] == ADMIN_LABEL
+        for action in diagnostics['actions']
+        if action['name'] == 'publish'
+    ]
+    assert publish['stats'].calls == 1
+
+
+def test_metrics_view(app, registry):
+    registry.observe_action(ADMIN_LABEL, 'publish', 0.02)
+
+    # mounted without authentication by the test project, e.g. for a scraper
+    response = app.get(reverse('inline_actions_metrics'))
+    assert response.content_type == 'text/plain'
+    assert 'inline_actions_action_calls_total' in response.text
+
+
+def test_metrics_are_not_exposed_by_the_admin():
+    with pytest.raises(NoReverseMatch):
+        reverse('admin:blog_article_inline_actions_metrics')
+
+
+@pytest.mark.django_db
+def test_diagnostics_require_staff(app, django_user_model):
+    user = django_user_model.objects.create_user(username='user', password='secret')
+    app.set_user(user)
+
+    url = reverse('admin:blog_article_inline_actions_diagnostics')
+    response = app.get(url)
+    assert response.status_code == 302
+    assert reverse('admin:login') in response.location
@@ -1,7 +1,10 @@
 import pytest
 from django.urls import reverse
 
+from inline_actions.tokens import TOKEN_FIELD
+
 from ..models import Article
+from .utils import action_token, rendered_tokens
 
 
 def test_actions_available(admin_client, article):
@@ -84,10 +87,8 @@ def test_actions_rendered(admin_client, article, action):
     url = reverse('admin:blog_article_changelist')
     changelist = admin_client.get(url)
 
-    input_name = '_action__articleadmin__admin__{}__blog__article__{}'.format(
-        action, article.pk
-    )
-    assert input_name in dict(changelist.form.fields)
+    input_name = action_token('', action, article.pk)
+    assert input_name in rendered_tokens(changelist.form)
 
 
 def test_publish_action(admin_client, mocker, article):
@@ -100,36 +101,32 @@ def test_publish_action(admin_client, mocker, article):
     assert article.status == Article.DRAFT
 
     article_url = reverse('admin:blog_article_changelist')
-    publish_input_name = (
-        '_action__articleadmin__admin__publish__blog__article__{}'.format(article.pk)
-    )
-    unpublish_input_name = (
-        '_action__articleadmin__admin__unpublish__blog__article__{}'.format(
-            article.pk,
-        )
-    )
+    publish_input_name = action_token('', 'publish', article.pk)
+    unpublish_input_name = action_token('', 'unpublish', article.pk)
 
     # open changelist
     changelist = admin_client.get(article_url)
     assert UnPublishActionsMixin.get_inline_actions.call_count > 0
-    assert publish_input_name in dict(changelist.form.fields)
+    assert publish_input_name in rendered_tokens(changelist.form)
 
     # execute and test publish action
-    changelist = changelist.form.submit(name=publish_input_name).follow()
+    changelist = changelist.form.submit(TOKEN_FIELD, value=publish_input_name).follow()
     # not available in django 1.7
     # article.refresh_from_db()
     article = Article.objects.get(pk=article.pk)
-    assert publish_input_name not in dict(changelist.form.fields)
-    assert unpublish_input_name in dict(changelist.form.fields)
+    assert publish_input_name not in rendered_tokens(changelist.form)
+    assert unpublish_input_name in rendered_tokens(changelist.form)
     assert UnPublishActionsMixin.publish.call_count == 1
     assert article.status == Article.PUBLISHED
 
     # execute and test unpublish action
-    changelist = changelist.form.submit(name=unpublish_input_name).follow()
+    changelist = changelist.form.submit(
+        TOKEN_FIELD, value=unpublish_input_name
+    ).follow()
     # article.refresh_from_db()
     article = Article.objects.get(pk=article.pk)
-    assert publish_input_name in dict(changelist.form.fields)
-    assert unpublish_input_name not in dict(changelist.form.fields)
+    assert publish_input_name in rendered_tokens(changelist.form)
+    assert unpublish_input_name not in rendered_tokens(changelist.form)
     assert UnPublishActionsMixin.unpublish.call_count == 1
     assert article.status == Article.DRAFT
 
@@ -144,10 +141,8 @@ def test_view_action(admin_client, mocker, article):
     changeview = admin_client.get(article_url)
 
     # execute and test view action
-    input_name = '_action__articleadmin__admin__view_action__blog__article__{}'.format(
-        article.pk
-    )
-    response = changeview.form.submit(name=input_name).follow()
+    input_name = action_token('', 'view_action', article.pk)
+    response = changeview.form.submit(TOKEN_FIELD, value=input_name).follow()
     assert ViewAction.view_action.call_count == 1
     article_change_url = reverse('admin:blog_article_change', args=(article.pk,))
     assert response.request.path == article_change_url
@@ -159,3 +154,188 @@ def test_no_actions_on_changelist(admin_client, article):
     changelist = admin_client.get(url)
 
     assert 'field-render_inline_actions' not in changelist.content.decode('utf8')
+
+
+def test_actions_computed_once_per_page(admin_client, mocker, author):
+    """The actions of all rows are computed using a single batch call."""
+    from ..admin import ArticleAdmin
+
+    for i in range(3):
+        Article.objects.create(author=author, title='Article {}'.format(i))
+
+    batch = mocker.spy(ArticleAdmin, 'get_inline_actions_for_objects')
+    single = mocker.spy(ArticleAdmin, 'get_inline_actions')
+
+    url = reverse('admin:blog_article_changelist')
+    admin_client.get(url)
+
+    assert batch.call_count == 1
+    assert len(batch.call_args[0][2]) == 3
+    assert single.call_count == 3
+
+
+def test_batch_actions_are_used_for_rendering(admin_client, mocker, article):
+    """Rendering should use the actions returned by the batch hook."""
+    from ..admin import ArticleAdmin
+
+    mocker.patch.object(
+        ArticleAdmin,
+        'get_inline_actions_for_objects',
+        side_effect=lambda request, objs: {obj.pk: ['unpublish'] for obj in objs},
+    )
+
+    url = reverse('admin:blog_article_changelist')
+    changelist = admin_client.get(url)
+
+    tokens = rendered_tokens(changelist.form)
+    assert action_token('', 'unpublish', article.pk) in tokens
+    assert action_token('', 'publish', article.pk) not in tokens
+
+
+def _select_rows(form, articles):
+    pks = {str(article.pk) for article in articles}
+    for checkbox in form.fields['_selected_action']:
+        checkbox.checked = checkbox._value in pks
+
+
+@pytest.mark.parametrize('clicked_index, expected', [(0, 3), (2, 1)])
+def test_multiple_selected_rows(admin_client, mocker, author, clicked_index, expected):
+    """Actions are applied to all selected rows, if the clicked row is selected."""
+    from ..admin import UnPublishActionsMixin
+
+    publish = mocker.spy(UnPublishActionsMixin, 'publish')
+    articles = [
+        Article.objects.create(author=author, title='Article {}'.format(i))
+        for i in range(4)
+    ]
+
+    url = reverse('admin:blog_article_changelist')
+    changelist = admin_client.get(url)
+    _select_rows(changelist.form, articles[:2] + articles[3:])
+
+    input_name = action_token('', 'publish', articles[clicked_index].pk)
+    changelist.form.submit(TOKEN_FIELD, value=input_name).follow()
+
+    assert publish.call_count == expected
+    published = Article.objects.filter(status=Article.PUBLISHED)
+    assert published.count() == expected
+
+
+def test_selected_rows_are_loaded_once(admin_client, author):
+    """The selected rows are loaded by a single query and passed to the action."""
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    articles = [
+        Article.objects.create(author=author, title='Article {}'.format(i))
+        for i in range(3)
+    ]
+
+    url = reverse('admin:blog_article_changelist')
+    changelist = admin_client.get(url)
+    _select_rows(changelist.form, articles)
+
+    input_name = action_token('', 'publish', articles[0].pk)
+    with CaptureQueriesContext(connection) as queries:
+        changelist.form.submit(TOKEN_FIELD, value=input_name)
+
+    selects = [
+        query['sql']
+        for query in queries.captured_queries
+        if query['sql'].startswith('SELECT') and 'FROM "blog_article"' in query['sql']
+    ]
+    assert len(selects) == 1
+    assert Article.objects.filter(status=Article.PUBLISHED).count() == 3
+
+
+def test_selected_rows_without_action(admin_client, mocker, author):
+    """Selected rows, for which the action is not rendered, are left out."""
+    from ..admin import UnPublishActionsMixin
+
+    publish = mocker.spy(UnPublishActionsMixin, 'publish')
+    draft = Article.objects.create(author=author, title='Draft')
+    published = Article.objects.create(
+        author=author, title='Published', status=Article.PUBLISHED
+    )
+
+    url = reverse('admin:blog_article_changelist')
+    changelist = admin_client.get(url)
+    _select_rows(changelist.form, [draft, published])
+
+    input_name = action_token('', 'publish', draft.pk)
+    changelist.form.submit(TOKEN_FIELD, value=input_name).follow()
+
+    assert publish.call_count == 1
+    assert publish.call_args[0][2] == draft
+
+
+def test_multiple_selected_rows_with_response(admin_client, author):
+    """Rows after the first response are skipped and reported."""
+    articles = [
+        Article.objects.create(author=author, title='Article {}'.format(i))
+        for i in range(3)
+    ]
+
+    url = reverse('admin:blog_article_changelist')
+    changelist = admin_client.get(url)
+    _select_rows(changelist.form, articles)
+
+    input_name = action_token('', 'change_title', articles[0].pk)
+    response = changelist.form.submit(TOKEN_FIELD, value=input_name)
+    assert response.lxml.xpath('.//form')
+
+    changelist = admin_client.get(url)
+    messages = [str(message) for message in changelist.context['messages']]
+    assert messages == ["The action has not been applied to 2 more selected objects."]
+
+
+def test_bulk_action(admin_client, mocker, author):
+    """Actions with `bulk = True` receive all selected objects at once."""
+    from django.db.models import QuerySet
+
+    from ..admin import UnPublishActionsMixin
+
+    calls = []
+
+    def publish(self, request, queryset, parent_obj=None):
+        calls.append(queryset)
+        queryset.update(status=Article.PUBLISHED)
+
+    publish.bulk = True
+    mocker.patch.object(UnPublishActionsMixin, 'publish', publish)
+    articles = [
+        Article.objects.create(author=author, title='Article {}'.format(i))
+        for i in range(3)
+    ]
+
+    url = reverse('admin:blog_article_changelist')
+    changelist = admin_client.get(url)
+    _select_rows(changelist.form, articles)
+
+    input_name = action_token('', 'publish', articles[0].pk)
+    changelist.form.submit(TOKEN_FIELD, value=input_name).follow()
+
+    assert len(calls) == 1
+    assert isinstance(calls[0], QuerySet)
+    assert Article.objects.filter(status=Article.PUBLISHED).count() == 3
+
+    # without selection, a bulk action receives a single object queryset
+    Article.objects.update(status=Article.DRAFT)
+    changelist = admin_client.get(url)
+    input_name = action_token('', 'publish', articles[1].pk)
+    changelist.form.submit(TOKEN_FIELD, value=input_name).follow()
+    assert len(calls) == 2
+    assert list(calls[1]) == [articles[1]]
+
+
+def test_changelist_action_does_not_load_parent(admin_client, mocker, article):
+    """Actions on the changelist have no parent object to load."""
+    from ..admin import ArticleAdmin
+
+    changelist = admin_client.get(reverse('admin:blog_article_changelist'))
+    get_object = mocker.spy(ArticleAdmin, 'get_object')
+
+    input_name = action_token('', 'publish', article.pk)
+    changelist.form.submit(TOKEN_FIELD, value=input_name)
+
+    assert get_object.call_count == 0
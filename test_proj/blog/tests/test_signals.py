@@ -0,0 +1,78 @@
+import pytest
+from django.http import HttpResponseRedirect
+from django.urls import reverse
+
+from inline_actions.admin import QueryBudgetExceeded
+from inline_actions.testing import SignalCollector
+from inline_actions.tokens import TOKEN_FIELD
+
+from ..admin import ArticleAdmin, ArticleInline
+from ..models import Article
+from .utils import action_token
+
+
+def test_action_signals(admin_client, article):
+    changelist = admin_client.get(reverse('admin:blog_article_changelist'))
+
+    input_name = action_token('', 'publish', article.pk)
+    with SignalCollector() as collector:
+        changelist.form.submit(TOKEN_FIELD, value=input_name)
+
+    started, finished = collector.events
+    assert started['signal'] == 'inline_action_started'
+    assert started['sender'] is ArticleAdmin
+    assert started['action'] == 'publish'
+    assert started['pk'] == article.pk
+
+    assert finished['signal'] == 'inline_action_finished'
+    assert finished['pk'] == article.pk
+    assert finished['response_type'] is HttpResponseRedirect
+    assert finished['queries'] >= 1  # saves the article
+    assert finished['duration'] > 0
+
+
+def test_failed_action_signal(admin_client, mocker, article):
+    def publish(self, request, obj, parent_obj=None):
+        for __ in range(2):
+            Article.objects.count()
+
+    publish.max_queries = 1
+    mocker.patch.object(ArticleInline, 'publish', publish, create=True)
+
+    author_url = reverse('admin:blog_author_change', args=(article.author.pk,))
+    changeview = admin_client.get(author_url)
+    input_name = action_token('articleinline', 'publish', article.pk)
+
+    with SignalCollector() as collector:
+        with pytest.raises(QueryBudgetExceeded):
+            changeview.form.submit(TOKEN_FIELD, value=input_name)
+
+    (failed,) = collector.events_for('inline_action_failed')
+    assert failed['sender'] is ArticleInline
+    assert failed['queries'] == 2
+    assert isinstance(failed['exception'], QueryBudgetExceeded)
+    assert collector.events_for('inline_action_finished') == []
+
+
+def test_rendered_signal(admin_client, author):
+    for index in range(3):
+        Article.objects.create(author=author, title=str(index), body='')
+
+    with SignalCollector() as collector:
+        admin_client.get(reverse('admin:blog_author_change', args=(author.pk,)))
+
+    (rendered,) = collector.events_for('inline_actions_rendered')
+    assert rendered['sender'] is ArticleInline
+    assert rendered['rows'] == 3
+    assert rendered['duration'] > 0
+
+
+def test_no_timings_without_receivers(rf):
+    from django.contrib import admin
+    from django.template.response import TemplateResponse
+
+    request = rf.get('/')
+    response = TemplateResponse(request, 'custom_inline_actions.html')
+    ArticleAdmin(Article, admin.site)._track_render_timings(request, response)
+
+    assert response._post_render_callbacks == []
@@ -1,15 +1,13 @@
 import pytest
 
 from inline_actions.templatetags.inline_action_tags import render_inline_action_fields
+from inline_actions.tokens import TOKEN_FIELD
 
 
 def test_mulitple_actions_are_triggered(rf):
     request = rf.post(
         '/some/url/',
-        data={
-            '_action__admin__NAME1__blog__blog__1': "",
-            '_action__admin__NAME2__blog__blog__1': "",
-        },
+        data={TOKEN_FIELD: ['TOKEN1', 'TOKEN2']},
     )
     context = {'request': request}
 
@@ -34,15 +32,32 @@ def test_no_action_is_triggered(rf):
 
 
 def test_render_action(rf):
-    action_name = '_action__admin__NAME1__blog__blog__1'
+    token = ':publish:1:abcdefghijkl'
     request = rf.post(
         '/some/url/',
-        data={
-            '{}'.format(action_name): "",
-        },
+        data={TOKEN_FIELD: token},
     )
     context = {'request': request}
 
     content = render_inline_action_fields(context)
-    expected_content = '<input type="hidden" name="{}" value="">'.format(action_name)
+    expected_content = '<input type="hidden" name="{}" value="{}">'.format(
+        TOKEN_FIELD, token
+    )
     assert content == expected_content
+
+
+def test_render_action_is_escaped(rf):
+    request = rf.post(
+        '/some/url/',
+        data={TOKEN_FIELD: '"><script>'},
+    )
+    context = {'request': request}
+
+    content = render_inline_action_fields(context)
+    assert '<script>' not in content
+
+
+def test_no_request():
+    with pytest.raises(RuntimeError) as exc_info:
+        render_inline_action_fields({})
+    assert str(exc_info.value) == "No inline action has been triggered."
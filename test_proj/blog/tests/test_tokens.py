@@ -0,0 +1,129 @@
+import pytest
+from django.core.signing import BadSignature
+from django.test import override_settings
+from django.urls import reverse
+
+from inline_actions.tokens import (
+    TOKEN_FIELD,
+    get_action_tokens,
+    make_token,
+    parse_token,
+)
+
+
+def test_roundtrip():
+    token = make_token('articleinline:publish:', 42)
+    assert parse_token(token) == ('articleinline', 'publish', '42')
+
+
+def test_pk_containing_separator():
+    token = make_token(':publish:', 'some:key')
+    assert parse_token(token) == ('', 'publish', 'some:key')
+
+
+def test_compact():
+    token = make_token('articleinline:publish:', 42)
+    assert len(token) < len(
+        '_action__articleinline__inline__publish__blog__article__42'
+    )
+
+
+@pytest.mark.parametrize(
+    'token',
+    [
+        '',
+        'no-signature',
+        'articleinline:publish:42',
+        'articleinline:delete_action:42:AAAAAAAAAAAA',
+    ],
+)
+def test_invalid_token(token):
+    with pytest.raises(BadSignature):
+        parse_token(token)
+
+
+def test_tampered_token():
+    token = make_token('articleinline:publish:', 42)
+    signature = token.rsplit(':', 1)[1]
+    forged = 'articleinline:delete_action:42:{}'.format(signature)
+
+    with pytest.raises(BadSignature):
+        parse_token(forged)
+
+
+def test_depends_on_secret_key():
+    token = make_token('articleinline:publish:', 42)
+
+    with override_settings(SECRET_KEY='another secret'):
+        with pytest.raises(BadSignature):
+            parse_token(token)
+    assert parse_token(token)
+
+
+def test_depends_on_scope():
+    token = make_token(':publish:', 42, 'admin:blog.article')
+    assert parse_token(token, 'admin:blog.article') == ('', 'publish', '42')
+
+    for scope in ('admin:blog.author', 'other_admin:blog.article', ''):
+        with pytest.raises(BadSignature):
+            parse_token(token, scope)
+
+
+def test_token_of_other_admin_is_rejected(admin_client, article):
+    """A token rendered by one admin is not accepted by another admin."""
+    from ..models import Article
+    from .utils import rendered_tokens
+
+    changelist = admin_client.get(reverse('admin:blog_article_changelist'))
+    (token,) = [
+        token
+        for token in rendered_tokens(changelist.form)
+        if token.startswith(':publish:')
+    ]
+
+    url = reverse('admin:blog_author_changelist')
+    author_changelist = admin_client.get(url)
+    response = admin_client.post(
+        url,
+        {
+            TOKEN_FIELD: token,
+            'csrfmiddlewaretoken': author_changelist.form['csrfmiddlewaretoken'].value,
+        },
+        expect_errors=True,
+    )
+    assert response.status_code == 400
+
+    article.refresh_from_db()
+    assert article.status == Article.DRAFT
+
+
+def test_forged_token_is_rejected(admin_client, article):
+    url = reverse('admin:blog_article_changelist')
+    changelist = admin_client.get(url)
+    forged = ':delete_view:{}:AAAAAAAAAAAA'.format(article.pk)
+
+    response = admin_client.post(
+        url,
+        {
+            TOKEN_FIELD: forged,
+            'csrfmiddlewaretoken': changelist.form['csrfmiddlewaretoken'].value,
+        },
+        expect_errors=True,
+    )
+    assert response.status_code == 400
+
+
+def test_action_tokens_of_get_request(rf):
+    request = rf.get('/some/url/', data={TOKEN_FIELD: 'TOKEN'})
+    assert get_action_tokens(request) == []
+
+
+def test_action_tokens_of_post_request(rf):
+    data = {'form-{}-title'.format(i): 'title' for i in range(500)}
+    data[TOKEN_FIELD] = 'TOKEN'
+    request = rf.post('/some/url/', data=data)
+    assert get_action_tokens(request) == ['TOKEN']
+
+
+def test_action_tokens_without_request():
+    assert get_action_tokens(None) == []
@@ -0,0 +1,107 @@
+import pytest
+from django.test import override_settings
+from django.urls import reverse, set_script_prefix, set_urlconf
+from django.utils import translation
+
+from inline_actions import utils
+from inline_actions.utils import get_admin_url, get_content_disposition
+
+from ..models import Article
+
+
+@pytest.fixture(autouse=True)
+def clear_admin_url_cache():
+    utils.clear_admin_url_cache()
+    yield
+    utils.clear_admin_url_cache()
+
+
+def test_changelist_url():
+    url = get_admin_url('admin', Article._meta, 'changelist')
+    assert url == reverse('admin:blog_article_changelist')
+
+
+@pytest.mark.parametrize('pk', [1, 42, 'some:key', 'with space', 'a/b?c#d'])
+def test_change_url(pk):
+    url = get_admin_url('admin', Article._meta, 'change', pk)
+    assert url == reverse('admin:blog_article_change', args=(pk,))
+
+
+def test_url_is_resolved_once(mocker):
+    reverse_spy = mocker.spy(utils, 'reverse')
+
+    for pk in range(3):
+        get_admin_url('admin', Article._meta, 'change', pk)
+        get_admin_url('admin', Article._meta, 'changelist')
+
+    assert reverse_spy.call_count == 2
+
+
+def test_cache_cleared_on_urlconf_override():
+    get_admin_url('admin', Article._meta, 'changelist')
+    assert utils._admin_url_cache
+
+    with override_settings(ROOT_URLCONF='test_proj.urls'):
+        assert not utils._admin_url_cache
+
+
+def test_cache_depends_on_urlconf(mocker):
+    reverse_spy = mocker.spy(utils, 'reverse')
+    get_admin_url('admin', Article._meta, 'changelist')
+
+    set_urlconf('test_proj.urls')
+    try:
+        get_admin_url('admin', Article._meta, 'changelist')
+    finally:
+        set_urlconf(None)
+
+    assert reverse_spy.call_count == 2
+
+
+def test_cache_depends_on_language(mocker):
+    reverse_spy = mocker.spy(utils, 'reverse')
+    get_admin_url('admin', Article._meta, 'changelist')
+
+    with translation.override('de'):
+        get_admin_url('admin', Article._meta, 'changelist')
+
+    assert reverse_spy.call_count == 2
+
+
+def test_cache_depends_on_script_prefix():
+    set_script_prefix('/prefix/')
+    try:
+        url = get_admin_url('admin', Article._meta, 'changelist')
+    finally:
+        set_script_prefix('/')
+
+    assert url == '/prefix/admin/blog/article/'
+    assert get_admin_url('admin', Article._meta, 'changelist') == (
+        '/admin/blog/article/'
+    )
+
+
+def test_placeholders():
+    text = 'a{}b{}c{}'.format(
+        utils.make_placeholder(0), utils.make_placeholder(1), utils.make_placeholder(0)
+    )
+    parts = utils.split_placeholders(text)
+    assert parts == ['a', 0, 'b', 1, 'c', 0, '']
+    assert utils.fill_placeholders(parts, ['X', 'Y']) == 'aXbYcX'
+
+
+def test_without_placeholders():
+    parts = utils.split_placeholders('text')
+    assert utils.fill_placeholders(parts, []) == 'text'
+
+
+@pytest.mark.parametrize(
+    'filename, expected',
+    [
+        ('articles.csv', 'attachment; filename="articles.csv"'),
+        ('"quoted".csv', 'attachment; filename="\\"quoted\\".csv"'),
+        ('übersicht.csv', "attachment; filename*=utf-8''%C3%BCbersicht.csv"),
+    ],
+)
+def test_content_disposition(filename, expected):
+    assert get_content_disposition(filename) == expected
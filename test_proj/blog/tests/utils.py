@@ -0,0 +1,18 @@
+from inline_actions.tokens import TOKEN_FIELD, make_token
+
+
+def action_token(admin_key, action, pk, scope=None):
+    """
+    Returns the token of the button for `action` on `pk`.
+
+    By default, the token is signed for the article admin or, if `admin_key`
+    names an inline, for the author admin.
+    """
+    if scope is None:
+        scope = 'admin:blog.author' if admin_key else 'admin:blog.article'
+    return make_token('{}:{}:'.format(admin_key, action), pk, scope)
+
+
+def rendered_tokens(form):
+    """Returns the tokens of all rendered action buttons."""
+    return [field.value_if_submitted() for field in form.fields.get(TOKEN_FIELD, [])]
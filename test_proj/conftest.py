@@ -1,9 +1,17 @@
 import pytest
 from django_webtest import DjangoTestApp, WebTestMixin
 
+from inline_actions.testing import enforce_query_budgets
 from test_proj.blog.models import Article, Author
 
 
+@pytest.fixture(autouse=True)
+def query_budgets():
+    """Checks the `max_queries` budgets of the admins in all tests."""
+    with enforce_query_budgets():
+        yield
+
+
 @pytest.fixture(scope='function')
 def app(request):
     """WebTest's TestApp.
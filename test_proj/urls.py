@@ -1,6 +1,10 @@
 from django.contrib import admin
 from django.urls import path
 
+from inline_actions.metrics import prometheus_view
+
 urlpatterns = [
     path('admin/', admin.site.urls),
+    # a real project mounts the metrics behind the authentication of its scraper
+    path('metrics/', prometheus_view, name='inline_actions_metrics'),
 ]